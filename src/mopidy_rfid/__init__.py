@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import pathlib
 from typing import Any
@@ -9,41 +10,62 @@ from mopidy import ext
 
 logger = logging.getLogger(__name__)
 
+_PKG_DIR = pathlib.Path(__file__).parent
+_EXT_CONF = _PKG_DIR / "ext.conf"
+_WEB_DIR = _PKG_DIR / "web"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_default_config() -> str:
+    # ext.conf ships with the package and never changes at runtime
+    try:
+        return _EXT_CONF.read_bytes().decode("utf-8")
+    except FileNotFoundError:
+        logger.error(f"RFID extension: ext.conf not found at {_EXT_CONF}")
+        return ""
+
+
+# Validators are immutable, so one instance can back several keys
+_BOOLEAN = mopidy_config.Boolean()
+_PIN = mopidy_config.Integer(minimum=0, maximum=40)
+_BRIGHTNESS = mopidy_config.Integer(minimum=0, maximum=255)
+
+# Static description of the [rfid] config section
+_SCHEMA_FIELDS: tuple[tuple[str, mopidy_config.ConfigValue], ...] = (
+    # Standard Mopidy-Option
+    ("enabled", _BOOLEAN),
+    # Hardware-Pins
+    ("pin_rst", _PIN),
+    ("pin_button_led", _PIN),
+    # LED Einstellungen
+    ("led_enabled", _BOOLEAN),
+    ("led_pin", _PIN),
+    ("led_count", mopidy_config.Integer(minimum=1)),
+    ("led_brightness", _BRIGHTNESS),
+    ("led_idle_brightness", _BRIGHTNESS),
+    # Datenbank Pfad
+    ("mappings_db_path", mopidy_config.Path(optional=True)),
+)
+
+
+def _build_config_schema(ext_name: str) -> mopidy_config.ConfigSchema:
+    schema = mopidy_config.ConfigSchema(ext_name)
+    for key, validator in _SCHEMA_FIELDS:
+        schema[key] = validator
+    return schema
+
+
 class Extension(ext.Extension):
     dist_name = "mopidy-rfid"
     ext_name = "rfid"
     version = "0.1.0"
 
     def get_default_config(self) -> str:
-        # Sicherer Pfad zur ext.conf
-        conf_file = pathlib.Path(__file__).parent / "ext.conf"
-        try:
-            return conf_file.read_text()
-        except FileNotFoundError:
-            logger.error(f"RFID extension: ext.conf not found at {conf_file}")
-            return ""
+        return _load_default_config()
 
     def get_config_schema(self) -> mopidy_config.ConfigSchema:
-        schema = mopidy_config.ConfigSchema(self.ext_name)
-        
-        # Standard Mopidy-Option
-        schema["enabled"] = mopidy_config.Boolean()
-        
-        # Hardware-Pins
-        schema["pin_rst"] = mopidy_config.Integer(minimum=0, maximum=40)
-        schema["pin_button_led"] = mopidy_config.Integer(minimum=0, maximum=40)
-        
-        # LED Einstellungen
-        schema["led_enabled"] = mopidy_config.Boolean()
-        schema["led_pin"] = mopidy_config.Integer(minimum=0, maximum=40)
-        schema["led_count"] = mopidy_config.Integer(minimum=1)
-        schema["led_brightness"] = mopidy_config.Integer(minimum=0, maximum=255)
-        schema["led_idle_brightness"] = mopidy_config.Integer(minimum=0, maximum=255)
-        
-        # Datenbank Pfad
-        schema["mappings_db_path"] = mopidy_config.Path(optional=True)
-        
-        return schema
+        # Fresh schema per call so callers may extend it; the validators are shared
+        return _build_config_schema(self.ext_name)
 
     def setup(self, registry: Any) -> None:
         # 1. Registrierung des Frontends (Hintergrund-Logik)
@@ -65,7 +87,6 @@ class Extension(ext.Extension):
 
     def get_bundle_dir(self) -> str:
         # Das hier macht die Extension unter :6680/rfid/ sichtbar
-        bundle_dir = pathlib.Path(__file__).parent / "web"
-        if not bundle_dir.exists():
-            logger.warning(f"RFID extension: Web bundle directory not found at {bundle_dir}")
-        return str(bundle_dir)
\ No newline at end of file
+        if not _WEB_DIR.exists():
+            logger.warning(f"RFID extension: Web bundle directory not found at {_WEB_DIR}")
+        return str(_WEB_DIR)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
 import logging
+import re
 import time
 import threading
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, TYPE_CHECKING
 from urllib.parse import urlparse, unquote
 
 if TYPE_CHECKING:
@@ -21,11 +24,15 @@ try:
 except Exception:  # pragma: no cover - runtime only
     Core = object  # type: ignore
 
-from .rfid_manager import RFIDManager
-from .led_manager import LEDManager
-from .mappings_db import MappingsDB
-from .sounds_config import SoundsConfig
-from .led_config import LedConfig
+try:
+    from mopidy.core import CoreListener  # type: ignore
+except Exception:  # pragma: no cover - runtime only
+    class CoreListener:  # type: ignore
+        """Stand-in so the frontend still imports without mopidy.core."""
+
+if TYPE_CHECKING:
+    from .rfid_manager import RFIDManager
+    from .led_manager import LEDManager
 
 logger = logging.getLogger("mopidy_rfid")
 
@@ -37,75 +44,267 @@ else:
     _BaseClass = object  # type: ignore
 
 
-class RFIDFrontend(_BaseClass):
+# URI type segments that are expanded into their tracks before queueing
+_EXPANDABLE_KINDS = frozenset({"album", "playlist"})
+
+# LED colors (R, G, B); the yellow variants are used while Bluetooth audio is connected
+_COLOR_WHITE = (255, 255, 255)
+_COLOR_GREEN = (0, 255, 0)
+_COLOR_YELLOW = (255, 255, 0)
+_COLOR_READY = (0, 50, 0)
+_COLOR_STANDBY = (0, 8, 0)
+_COLOR_STANDBY_BT = (8, 8, 0)
+# Standby comet: seconds per step and tail length; welcome/farewell scan step delay
+_STANDBY_DELAY = 5.0
+_STANDBY_TRAIL = 2
+_SCAN_DELAY = 0.05
+# How long a Bluetooth audio check result is reused before shelling out again (seconds)
+_BT_CACHE_TTL = 2.0
+# Per-command limit for pactl/bluetoothctl so a hung daemon can't stall the caller (seconds)
+_BT_CMD_TIMEOUT = 1.0
+# `pactl subscribe` lines announcing that an output sink appeared or went away
+_PACTL_SINK_EVENT = re.compile(r"Event '(?:new|remove)' on sink\b")
+# Upper bound on how long shutdown waits for the farewell sound to finish (seconds)
+_FAREWELL_TIMEOUT = 5.0
+
+
+def _uri_kind(uri: str) -> str:
+    """Return the first album/playlist type segment of a URI, or "" for anything else.
+
+    Equivalent to checking ``":album:" in uri`` / ``":playlist:" in uri``, e.g.
+    ``spotify:album:xyz`` -> ``"album"``.
+    """
+    # Common case: the type is the second segment (scheme:kind:id)
+    _, _, rest = uri.partition(":")
+    kind, sep, tail = rest.partition(":")
+    if sep and kind in _EXPANDABLE_KINDS:
+        return kind
+    # Nested forms such as spotify:user:<name>:playlist:<id>
+    if ":" in tail:
+        for part in tail.split(":")[:-1]:
+            if part in _EXPANDABLE_KINDS:
+                return part
+    return ""
+
+
+def _probe_file_length_ms(uri: Optional[str]) -> Optional[int]:
+    """Try to determine track length in milliseconds for file:// URIs via mutagen.
+
+    Returns None if probing fails or the URI isn't a local file. Successful
+    results are cached per URI so replaying a track doesn't re-parse the file;
+    failures are retried, e.g. once a USB stick or network mount is ready.
+    """
+    try:
+        return _cached_file_length_ms(uri)
+    except LookupError:
+        return None
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_file_length_ms(uri: Optional[str]) -> int:
+    # lru_cache does not store exceptions, so a failed probe is not remembered
+    length_ms = _read_file_length_ms(uri)
+    if length_ms is None:
+        raise LookupError(uri)
+    return length_ms
+
+
+def _read_file_length_ms(uri: Optional[str]) -> Optional[int]:
+    try:
+        if not uri or not isinstance(uri, str) or not uri.startswith("file:"):
+            return None
+        if uri.startswith("file:///") and "?" not in uri and "#" not in uri:
+            # Common local form: the path follows the empty authority directly
+            path = unquote(uri[7:])
+        else:
+            # Host form or other variants (rare)
+            path = unquote(urlparse(uri).path or "")
+        if not path:
+            return None
+        try:
+            from mutagen import File as MutagenFile  # type: ignore
+        except Exception:
+            return None
+        audio = MutagenFile(path)
+        if audio is None or not hasattr(audio, "info") or getattr(audio, "info", None) is None:
+            return None
+        info = audio.info
+        length_sec = getattr(info, "length", None)
+        if length_sec is None:
+            return None
+        # Convert seconds (float) to milliseconds (int)
+        length_ms = int(float(length_sec) * 1000.0)
+        if length_ms > 0:
+            return length_ms
+        return None
+    except Exception:
+        return None
+
+
+class _TagAction(NamedTuple):
+    """What a scanned tag does, resolved once per mapping."""
+
+    uri: str
+    action: str  # reported to the Web UI: "play", "toggle", "stop" or "none"
+    run: Optional[Callable[[], None]]
+
+
+_NO_ACTION = _TagAction("", "none", None)
+
+
+class _ConfigView(NamedTuple):
+    """Hardware settings from the [rfid] section, already typed by the ConfigSchema."""
+
+    pin_rst: int
+    pin_button_led: int
+    led_enabled: bool
+    led_pin: int
+    led_count: int
+    led_brightness: int
+    led_idle_brightness: int
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> _ConfigView:
+        return cls(
+            pin_rst=config.get("pin_rst", 25),
+            pin_button_led=config.get("pin_button_led", 13),
+            led_enabled=config.get("led_enabled", True),
+            led_pin=config.get("led_pin", 12),
+            led_count=config.get("led_count", 16),
+            led_brightness=config.get("led_brightness", 60),
+            led_idle_brightness=config.get("led_idle_brightness", 10),
+        )
+
+
+@functools.cache
+def _load_hardware_managers() -> tuple[type["RFIDManager"], type["LEDManager"]]:
+    """Import the hardware manager classes on first use.
+
+    They pull in SPI/GPIO bindings which are slow to import on a Pi.
+    """
+    from .rfid_manager import RFIDManager as _RFIDManager
+    from .led_manager import LEDManager as _LEDManager
+    return _RFIDManager, _LEDManager
+
+
+class RFIDFrontend(_BaseClass, CoreListener):
     """Pykka ThreadingActor frontend bridging Mopidy core and hardware managers."""
 
     def __init__(self, config: Dict[str, Any], core: Any) -> None:
+        # Storage helpers are only needed once the actor is built, not at import time
+        from .led_config import LedConfig
+        from .mappings_db import MappingsDB
+        from .sounds_config import SoundsConfig
+
         if pykka is not None:
             super().__init__()
-        self._config = config.get("rfid", {}) if isinstance(config, dict) else {}
+        self._config = (config or {}).get("rfid") or {}
+        self._cfg = _ConfigView.from_config(self._config)
         self.core = core
-        self._rfid: Optional[RFIDManager] = None
-        self._led: Optional[LEDManager] = None
+        self._rfid: Optional["RFIDManager"] = None
+        self._led: Optional["LEDManager"] = None
+        self._led_enabled = False
         self._db = MappingsDB(self._config.get("mappings_db_path"))
         self._sounds = SoundsConfig(self._config.get("sounds_config_path"))
         self._led_cfg = LedConfig(self._config.get("led_config_path"))
+        # Sound URIs and LED feature flags, read once; see invalidate_config_cache()
+        self._cache_config()
         # Load config mappings as fallback/defaults
         self._config_mappings: Dict[str, str] = self._config.get("mappings", {}) or {}
+        # Config mappings in list_mappings() shape; DB rows override these
+        self._config_baseline: Dict[str, Dict[str, str]] = {
+            k: {"uri": v, "description": ""} for k, v in self._config_mappings.items()
+        }
+        # Tag -> URI for every known mapping: config defaults overlaid by DB rows, merged once.
+        # None marks a tag already looked up and found unmapped.
+        self._mappings: Dict[str, Optional[str]] = dict(self._config_mappings)
+        self._mappings.update({tag: m["uri"] for tag, m in self._db.list_all().items()})
+        self._mappings_lock = threading.Lock()
+        # Resolved tag actions; entries are dropped whenever a mapping changes
+        self._tag_actions: Dict[str, _TagAction] = {}
+        self._tag_actions_lock = threading.Lock()
         self._progress_thread: Optional[threading.Thread] = None
         self._progress_stop = threading.Event()
-        # Cached Bluetooth audio status determined at Mopidy startup
+        # Set by core events (and on stop) to wake the LED progress thread
+        self._progress_wake = threading.Event()
+        # Playback state and current track as last reported by core events
+        self._playback_state: str = "stopped"
+        self._cur_tl_track: Any = None
+        # (position in ms, time.monotonic() when it was reported); replaced as a whole
+        # so the progress thread never sees a half-updated pair
+        self._pos_anchor = (0, time.monotonic())
+        # Cached Bluetooth audio status determined at Mopidy startup, then kept
+        # current by the `pactl subscribe` watcher when PulseAudio is available
         self._bt_connected: bool = False
+        self._pactl_proc: Any = None
+        # Last live Bluetooth check and when it ran (see _is_bluetooth_audio_connected)
+        self._bt_cache_val = False
+        self._bt_cache_ts = float("-inf")
+        # Shared workers for hardware init (threads start on first submit)
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rfid")
+        # http module for Web UI broadcasts; None disables broadcasting
+        try:
+            from . import http as _http_mod
+        except ImportError:
+            logger.warning("RFIDFrontend: http module unavailable, Web UI events disabled")
+            _http_mod = None
+        self._http: Any = _http_mod
 
     def on_start(self) -> None:
         """Called by Mopidy when actor starts. Must return quickly."""
         logger.info("RFIDFrontend starting")
-        # Determine BT audio status once at startup and cache it
+        # Determine BT audio status at startup; the pactl watcher keeps it current
         try:
             self._bt_connected = bool(self._is_bluetooth_audio_connected())
             logger.info("RFIDFrontend: BT audio connected at startup: %s", self._bt_connected)
         except Exception:
             self._bt_connected = False
+        self._start_bt_watcher()
         # Start hardware initialization in background thread to avoid blocking
-        t = threading.Thread(target=self._init_hardware, name="rfid-hw-init", daemon=True)
-        t.start()
+        self._executor.submit(self._init_hardware)
         # Play welcome sound if configured
+        if self._welcome_uri:
+            self._play_sound("welcome", self._welcome_uri)
+
+    def _init_hardware(self) -> None:
+        """Initialize hardware in background thread."""
         try:
-            uri = self._sounds.get("welcome")
-            if uri and self.core is not None:
-                logger.info("RFIDFrontend: playing welcome sound: %s", uri)
-                self.core.tracklist.clear().get()
-                self.core.tracklist.add(uris=[uri]).get()
-                self.core.playback.play().get()
+            _load_hardware_managers()
         except Exception:
-            logger.exception("RFIDFrontend: failed to play welcome sound")
-        # LED welcome animation if enabled (may run after hardware init)
+            logger.exception("Failed to import hardware managers")
+            return
+        # LED ring and RFID reader share nothing; bring the reader up on the other worker
         try:
-            if self._led and getattr(self._led, '_enabled', False) and self._led_cfg.get("welcome"):
-                # Prefer animated welcome; use yellow if BT audio connected
-                try:
-                    col = (255, 255, 0) if self._bt_connected else (0, 255, 0)
-                    self._led.welcome_scan(color=col, delay=0.05)
-                except Exception:
-                    try:
-                        col = (255, 255, 0) if self._bt_connected else (0, 50, 0)
-                        self._led.show_ready(color=col)
-                    except Exception:
-                        self._led.show_ready()
+            rfid_done = self._executor.submit(self._init_rfid)
+        except RuntimeError:
+            # Executor already shut down (actor stopping)
+            return
+
+        # Core events only report changes; pick up whatever is playing right now
+        try:
+            if self.core is not None:
+                state_future = self.core.playback.get_state()
+                cp_future = self.core.playback.get_current_tl_track()
+                pos_future = self.core.playback.get_time_position()
+                self._playback_state = state_future.get() or "stopped"
+                self._cur_tl_track = cp_future.get()
+                self._set_position(pos_future.get() or 0)
         except Exception:
-            logger.exception("RFIDFrontend: LED welcome animation failed")
-        # Start remaining progress updater
+            logger.exception("RFIDFrontend: initial playback query failed")
+
+        self._init_led()
+        self._welcome_led()
+        # LED animations follow playback once the ring is ready
         self._start_progress_updater()
 
-    def _init_hardware(self) -> None:
-        """Initialize hardware in background thread."""
-        pin_rst = int(self._config.get("pin_rst", 25))
-        pin_button_led = int(self._config.get("pin_button_led", 13))
-        led_enabled = bool(self._config.get("led_enabled", True))
-        led_pin = int(self._config.get("led_pin", 12))
-        led_count = int(self._config.get("led_count", 16))
-        led_brightness = int(self._config.get("led_brightness", 60))
-        led_idle_brightness = int(self._config.get("led_idle_brightness", 10))
+        rfid_done.result()
+        logger.info("RFIDFrontend hardware initialization complete")
+
+    def _init_led(self) -> None:
+        cfg = self._cfg
+        led_enabled = cfg.led_enabled
+        led_brightness = cfg.led_brightness
+        led_idle_brightness = cfg.led_idle_brightness
         # Override with persisted values from LedConfig if present
         try:
             led_brightness = int(self._led_cfg.get_brightness())
@@ -116,88 +315,95 @@ class RFIDFrontend(_BaseClass):
         except Exception:
             pass
 
-        # Initialize LED manager
         try:
-            self._led = LEDManager(
+            _, led_cls = _load_hardware_managers()
+            led = led_cls(
                 led_enabled=led_enabled,
-                led_pin=led_pin,
-                led_count=led_count,
+                led_pin=cfg.led_pin,
+                led_count=cfg.led_count,
                 brightness=led_brightness,
                 idle_brightness=led_idle_brightness,
-                button_pin=pin_button_led,
+                button_pin=cfg.pin_button_led,
             )
-            if self._led and getattr(self._led, '_enabled', False):
+            self._led = led
+            self._led_enabled = bool(led and getattr(led, '_enabled', False))
+            if led is not None and self._led_enabled:
                 try:
-                    self._led.stop_standby_comet()
+                    led.stop_standby_comet()
                 except Exception:
                     pass
                 if led_enabled:
                     try:
-                        col_ready = (255, 255, 0) if self._bt_connected else (0, 50, 0)
-                        self._led.show_ready(color=col_ready)
+                        col_ready = _COLOR_YELLOW if self._bt_connected else _COLOR_READY
+                        led.show_ready(color=col_ready)
                     except Exception:
-                        self._led.show_ready()
-                    # Start standby comet (very low brightness, slow) — yellow if BT connected (cached)
+                        led.show_ready()
+                    # Start standby comet (very low brightness, slow) — yellow if BT connected
                     try:
-                        col_idle = (8, 8, 0) if self._bt_connected else (0, 8, 0)
-                        self._led.start_standby_comet(color=col_idle, delay=5.0, trail=2)
+                        col_idle = _COLOR_STANDBY_BT if self._bt_connected else _COLOR_STANDBY
+                        led.start_standby_comet(color=col_idle, delay=_STANDBY_DELAY, trail=_STANDBY_TRAIL)
                     except Exception:
                         pass
         except Exception:
             logger.exception("Failed to initialize LED manager")
             self._led = None
+            self._led_enabled = False
 
-        # Initialize RFID manager
+    def _welcome_led(self) -> None:
+        """LED welcome animation if enabled; runs once the ring is initialized."""
+        led = self._led
+        if led is not None and self._led_enabled and self._cfg_welcome:
+            try:
+                # Prefer animated welcome; use yellow if BT audio connected
+                anim = getattr(led, "welcome_scan", None)
+                if anim is not None:
+                    anim(color=_COLOR_YELLOW if self._bt_connected else _COLOR_GREEN, delay=_SCAN_DELAY)
+                else:
+                    led.show_ready(color=_COLOR_YELLOW if self._bt_connected else _COLOR_READY)
+            except Exception:
+                logger.exception("RFIDFrontend: LED welcome animation failed")
+
+    def _init_rfid(self) -> None:
         try:
-            self._rfid = RFIDManager(on_tag=self._on_tag_detected, pin_rst=pin_rst)
+            rfid_cls, _ = _load_hardware_managers()
+            self._rfid = rfid_cls(on_tag=self._on_tag_detected, pin_rst=self._cfg.pin_rst)
             if self._rfid:
                 self._rfid.start()
         except Exception:
             logger.exception("Failed to initialize RFID manager")
             self._rfid = None
 
-        logger.info("RFIDFrontend hardware initialization complete")
-
     def on_stop(self) -> None:
         """Called by Mopidy when actor stops."""
         logger.info("RFIDFrontend stopping")
         # Play farewell sound
-        try:
-            uri = self._sounds.get("farewell")
-            if uri and self.core is not None:
-                logger.info("RFIDFrontend: playing farewell sound: %s", uri)
-                self.core.tracklist.clear().get()
-                self.core.tracklist.add(uris=[uri]).get()
-                self.core.playback.play().get()
-        except Exception:
-            logger.exception("RFIDFrontend: failed to play farewell sound")
+        if self._farewell_uri:
+            self._play_sound("farewell", self._farewell_uri)
         # LED farewell animation if enabled
-        try:
-            if self._led and self._led_cfg.get("farewell"):
-                try:
-                    col = (255, 255, 0) if self._bt_connected else (0, 255, 0)
-                    self._led.farewell_scan(color=col, delay=0.05)
-                except Exception:
-                    try:
-                        col = (255, 255, 0) if self._bt_connected else (0, 255, 0)
-                        self._led.flash_confirm(color=col)
-                    except Exception:
-                        self._led.flash_confirm()
-        except Exception:
-            logger.exception("RFIDFrontend: LED farewell animation failed")
-        # Stop remaining progress updater
+        if self._led and self._cfg_farewell:
+            try:
+                col = _COLOR_YELLOW if self._bt_connected else _COLOR_GREEN
+                anim = getattr(self._led, "farewell_scan", None)
+                if anim is not None:
+                    anim(color=col, delay=_SCAN_DELAY)
+                else:
+                    self._led.flash_confirm(color=col)
+            except Exception:
+                logger.exception("RFIDFrontend: LED farewell animation failed")
+        # Stop remaining progress updater and release the worker threads
         self._stop_progress_updater()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._stop_bt_watcher()
         # Stop standby comet
+        led = self._led
         try:
-            if self._led and getattr(self._led, '_enabled', False):
-                self._led.stop_standby_comet()
+            if led is not None and self._led_enabled:
+                led.stop_standby_comet()
         except Exception:
             pass
         # Allow farewell sound to play before shutdown to avoid SEGV in teardown
-        try:
-            time.sleep(3)
-        except Exception:
-            pass
+        if self._farewell_uri and self.core is not None:
+            self._wait_for_farewell()
         if self._rfid:
             try:
                 self._rfid.stop()
@@ -209,25 +415,66 @@ class RFIDFrontend(_BaseClass):
             except Exception:
                 logger.exception("Error shutting down LED manager")
 
+    def _wait_for_farewell(self, timeout: float = _FAREWELL_TIMEOUT) -> None:
+        """Block until the farewell sound has stopped playing, at most ``timeout`` seconds.
+
+        Core events are queued behind on_stop in this actor's inbox, so the
+        playback state is polled instead of waiting for track_playback_ended.
+        """
+        deadline = time.monotonic() + timeout
+        try:
+            while self.core.playback.get_state().get() == "playing":
+                if time.monotonic() >= deadline:
+                    logger.info("RFIDFrontend: farewell sound still playing after %.1fs", timeout)
+                    return
+                time.sleep(0.1)
+        except Exception:
+            logger.exception("RFIDFrontend: waiting for farewell sound failed")
+
     def _start_progress_updater(self) -> None:
+        # Nothing to animate without a ring; also don't start after on_stop
+        led = self._led
+        if led is None or not self._led_enabled or self._progress_stop.is_set():
+            return
         if self._progress_thread and self._progress_thread.is_alive():
             return
-        self._progress_stop.clear()
+        led_count = led.led_count
+
         def _run():
             last_state = None
-            while not self._progress_stop.is_set():
+            # Track length only changes with the track; remember it for the current URI
+            last_uri = None
+            last_length_ms = 0
+            # LED count last pushed to the ring; the ring only changes when this does
+            last_remain_leds = -1
+            while True:
                 try:
+                    # Clear before reading so an event arriving during this pass wakes the next one
+                    self._progress_wake.clear()
+                    state = self._playback_state
+                    # Re-read each pass; the Web UI may toggle it (invalidate_config_cache)
+                    remaining = self._cfg_remaining
+                    # Debug output is skipped without building its arguments unless enabled
+                    debug = logger.isEnabledFor(logging.DEBUG)
                     # Always manage idle/paused/play animations regardless of 'remaining' toggle;
                     # gate only the remaining-specific visuals inside.
-                    if self._led and getattr(self._led, '_enabled', False) and self.core is not None:
-                        state = self.core.playback.get_state().get()
+                    if self.core is not None:
+                        cp = self._cur_tl_track
+                        pos_ms = 0
+                        if state in ("playing", "paused"):
+                            pos_ms = self._position_ms()
+                        cur_uri = cp.track.uri if cp and cp.track else None
+                        if cur_uri != last_uri:
+                            last_length_ms = self._track_length_ms(cp) or 0
+                            last_uri = cur_uri
+                        length_ms = last_length_ms
 
                         # Defensive: ensure standby comet is stopped whenever we're not actually stopped.
                         # This avoids cases where backend state changes are missed and the comet keeps showing
                         # (seen as three green LEDs) while playing/paused, especially with the 'file' backend.
                         try:
                             if state in ("playing", "paused"):
-                                self._led.stop_standby_comet()
+                                led.stop_standby_comet()
                         except Exception:
                             pass
 
@@ -238,209 +485,239 @@ class RFIDFrontend(_BaseClass):
                                 if state == "playing":
                                     # Stop idle comet and paused animation when playback starts
                                     try:
-                                        if getattr(self._led, "_standby_running", False):
+                                        if debug and getattr(led, "_standby_running", False):
                                             logger.debug("Frontend: stop standby comet (on play)")
-                                        self._led.stop_standby_comet()
+                                        led.stop_standby_comet()
                                     except Exception:
                                         logger.exception("Failed to stop standby comet on play")
                                     try:
-                                        if getattr(self._led, "_paused_running", False):
+                                        if debug and getattr(led, "_paused_running", False):
                                             logger.debug("Frontend: stop paused sweep (on play)")
-                                        self._led.stop_paused_sweep()
+                                        led.stop_paused_sweep()
                                     except Exception:
                                         logger.exception("Failed to stop paused sweep on play")
                                     # Immediately update LEDs to show correct remaining progress
-                                    if self._led_cfg.get("remaining"):
+                                    if remaining:
                                         try:
-                                            logger.debug("Frontend: update remaining progress on resume")
-                                            cp = self.core.playback.get_current_tl_track().get()
-                                            pos_ms = self.core.playback.get_time_position().get()
-                                            length_ms = None
-                                            try:
-                                                if cp and cp.track and cp.track.length:
-                                                    length_ms = int(cp.track.length)
-                                            except Exception:
-                                                length_ms = None
-                                            # Fallback: probe file URI length via mutagen if not provided by backend
-                                            if (not length_ms or length_ms <= 0) and cp and getattr(cp, "track", None):
-                                                try:
-                                                    uri = getattr(cp.track, "uri", None)
-                                                    length_ms = self._probe_file_length_ms(uri)
-                                                except Exception:
-                                                    pass
-                                            if length_ms and length_ms > 0:
+                                            if debug:
+                                                logger.debug("Frontend: update remaining progress on resume")
+                                            if length_ms > 0:
                                                 remain_ratio = max(0.0, min(1.0, 1.0 - (pos_ms/float(length_ms))))
-                                                self._led.remaining_progress(remain_ratio, color=(255,255,255))
+                                                led.remaining_progress(remain_ratio, color=_COLOR_WHITE)
                                         except Exception:
                                             logger.exception("Failed to update remaining progress on resume")
                                 elif state == "paused":
                                     # Stop standby comet and remaining progress, start paused animation
                                     try:
-                                        if getattr(self._led, "_standby_running", False):
+                                        if debug and getattr(led, "_standby_running", False):
                                             logger.debug("Frontend: stop standby comet (on pause)")
-                                        self._led.stop_standby_comet()
+                                        led.stop_standby_comet()
                                     except Exception:
                                         pass
                                     # Calculate current remain LEDs for paused animation
-                                    if self._led_cfg.get("remaining"):
+                                    if remaining:
                                         try:
-                                            logger.debug("Frontend: start paused sweep")
-                                            cp = self.core.playback.get_current_tl_track().get()
-                                            pos_ms = self.core.playback.get_time_position().get()
-                                            length_ms = None
-                                            try:
-                                                if cp and cp.track and cp.track.length:
-                                                    length_ms = int(cp.track.length)
-                                            except Exception:
-                                                length_ms = None
-                                            if (not length_ms or length_ms <= 0) and cp and getattr(cp, "track", None):
-                                                try:
-                                                    uri = getattr(cp.track, "uri", None)
-                                                    length_ms = self._probe_file_length_ms(uri)
-                                                except Exception:
-                                                    pass
-                                            if length_ms and length_ms > 0:
+                                            if debug:
+                                                logger.debug("Frontend: start paused sweep")
+                                            if length_ms > 0:
                                                 remain_ratio = max(0.0, min(1.0, 1.0 - (pos_ms/float(length_ms))))
-                                                remain_leds = int(round(self._led._led_count * remain_ratio))
-                                                sweep_col = (255, 255, 0) if self._is_bluetooth_audio_connected() else (0, 255, 0)
-                                                self._led.start_paused_sweep(remain_leds, sweep_color=sweep_col)
+                                                remain_leds = int(round(led_count * remain_ratio))
+                                                sweep_col = _COLOR_YELLOW if self._is_bluetooth_audio_connected() else _COLOR_GREEN
+                                                led.start_paused_sweep(remain_leds, sweep_color=sweep_col)
                                         except Exception:
                                             logger.exception("Failed to start paused sweep")
                                 else:
                                     # Stopped: stop paused animation, restart idle comet
                                     try:
-                                        if getattr(self._led, "_paused_running", False):
+                                        if debug and getattr(led, "_paused_running", False):
                                             logger.debug("Frontend: stop paused sweep (on stop)")
-                                        self._led.stop_paused_sweep()
+                                        led.stop_paused_sweep()
                                     except Exception:
                                         pass
                                     try:
-                                        logger.debug("Frontend: start standby comet (on stop)")
-                                        col_idle = (8, 8, 0) if self._bt_connected else (0, 8, 0)
-                                        self._led.start_standby_comet(color=col_idle, delay=5.0, trail=2)
+                                        if debug:
+                                            logger.debug("Frontend: start standby comet (on stop)")
+                                        col_idle = _COLOR_STANDBY_BT if self._bt_connected else _COLOR_STANDBY
+                                        led.start_standby_comet(color=col_idle, delay=_STANDBY_DELAY, trail=_STANDBY_TRAIL)
                                     except Exception:
                                         logger.exception("Failed to start standby comet on stop")
                             except Exception:
                                 logger.exception("Error handling LED animations on state change")
                             last_state = state
+                            last_remain_leds = -1
 
                         # Track remaining time when playing or paused
-                        if state in ("playing", "paused") and self._led_cfg.get("remaining"):
-                            cp = self.core.playback.get_current_tl_track().get()
-                            pos_ms = self.core.playback.get_time_position().get()
-                            length_ms = None
-                            try:
-                                if cp and cp.track and cp.track.length:
-                                    length_ms = int(cp.track.length)
-                            except Exception:
-                                length_ms = None
-                            # Fallback probe for file URIs if backend didn't provide a length yet
-                            if (not length_ms or length_ms <= 0) and cp and getattr(cp, "track", None):
-                                try:
-                                    uri = getattr(cp.track, "uri", None)
-                                    length_ms = self._probe_file_length_ms(uri)
-                                    if length_ms:
-                                        logger.debug("Frontend: probed file length via mutagen: %d ms", length_ms)
-                                except Exception:
-                                    pass
-                            if length_ms and length_ms > 0:
+                        if state in ("playing", "paused") and remaining:
+                            if length_ms > 0:
                                 remain_ratio = max(0.0, min(1.0, 1.0 - (pos_ms/float(length_ms))))
-                                remain_leds = int(round(self._led._led_count * remain_ratio))
-                                logger.debug(
-                                    "Progress updater: pos=%dms len=%dms ratio=%.3f remain_leds=%d",
-                                    pos_ms, length_ms, remain_ratio, remain_leds
-                                )
+                                remain_leds = int(round(led_count * remain_ratio))
+                                if debug:
+                                    logger.debug(
+                                        "Progress updater: pos=%dms len=%dms ratio=%.3f remain_leds=%d",
+                                        pos_ms, length_ms, remain_ratio, remain_leds
+                                    )
                                 try:
                                     if state == "playing":
-                                        self._led.remaining_progress(remain_ratio, color=(255,255,255))
+                                        if remain_leds != last_remain_leds:
+                                            led.remaining_progress(remain_ratio, color=_COLOR_WHITE)
                                     elif state == "paused":
                                         # Ensure paused sweep is running, then update remain count
                                         try:
-                                            if not getattr(self._led, "_paused_running", False):
-                                                sweep_col = (255, 255, 0) if self._bt_connected else (0, 255, 0)
-                                                self._led.start_paused_sweep(remain_leds, sweep_color=sweep_col)
+                                            if not getattr(led, "_paused_running", False):
+                                                sweep_col = _COLOR_YELLOW if self._bt_connected else _COLOR_GREEN
+                                                led.start_paused_sweep(remain_leds, sweep_color=sweep_col)
                                         except Exception:
                                             pass
-                                        self._led.update_paused_remain(remain_leds)
+                                        if remain_leds != last_remain_leds:
+                                            led.update_paused_remain(remain_leds)
+                                    last_remain_leds = remain_leds
                                 except Exception:
                                     logger.exception("Progress updater: LED update failed")
                         else:
+                            last_remain_leds = -1
                             # Reset cache when stopped
-                            if hasattr(self._led, '_last_remain_count'):
-                                logger.debug("Progress updater: clearing cache (state=%s)", state)
-                                delattr(self._led, '_last_remain_count')
+                            led.reset_remain_cache()
 
-                        # No periodic BT checks; colors depend on startup-cached status
-                    time.sleep(0.2)
+                        # No periodic BT checks; colors use _bt_connected (kept by the pactl watcher)
+                    # Only the remaining-time display needs periodic ticks; everything else
+                    # waits for the next core event
+                    ticking = state == "playing" and remaining
+                    self._progress_wake.wait(0.5 if ticking else None)
+                    if self._progress_stop.is_set():
+                        return
                 except Exception:
-                    time.sleep(0.5)
+                    if self._progress_stop.wait(0.5):
+                        return
         self._progress_thread = threading.Thread(target=_run, name="led-progress", daemon=True)
         self._progress_thread.start()
 
-    # --- Helpers ---
-    def _probe_file_length_ms(self, uri: Optional[str]) -> Optional[int]:
-        """Try to determine track length in milliseconds for file:// URIs via mutagen.
-
-        Returns None if probing fails or the URI isn't a local file.
-        """
+    def _track_length_ms(self, cp: Any) -> Optional[int]:
+        """Length of the current tl_track in ms, probing file URIs if the backend has none."""
+        length_ms = None
         try:
-            if not uri or not isinstance(uri, str) or not uri.startswith("file:"):
-                return None
-            parsed = urlparse(uri)
-            path = unquote(parsed.path or "")
-            if not path:
-                return None
+            if cp and cp.track and cp.track.length:
+                length_ms = int(cp.track.length)
+        except Exception:
+            length_ms = None
+        # Fallback: probe file URI length via mutagen if not provided by backend
+        if (not length_ms or length_ms <= 0) and cp and getattr(cp, "track", None):
             try:
-                from mutagen import File as MutagenFile  # type: ignore
+                uri = getattr(cp.track, "uri", None)
+                length_ms = _probe_file_length_ms(uri)
+                if length_ms:
+                    logger.debug("Frontend: probed file length via mutagen: %d ms", length_ms)
             except Exception:
-                return None
-            audio = MutagenFile(path)
-            if audio is None or not hasattr(audio, "info") or getattr(audio, "info", None) is None:
-                return None
-            info = audio.info
-            length_sec = getattr(info, "length", None)
-            if length_sec is None:
-                return None
-            # Convert seconds (float) to milliseconds (int)
-            length_ms = int(float(length_sec) * 1000.0)
-            if length_ms > 0:
-                return length_ms
-            return None
-        except Exception:
-            return None
+                pass
+        return length_ms
 
     def _stop_progress_updater(self) -> None:
         try:
             self._progress_stop.set()
+            self._progress_wake.set()
         except Exception:
             pass
         # thread will end shortly
 
+    # --- Core events (delivered on the actor thread; the progress thread does the LED work) ---
+    def playback_state_changed(self, old_state: str, new_state: str) -> None:
+        # Core changes state before sending paused/resumed, so re-anchor first; otherwise
+        # _position_ms() would count the pause as played time (or stop counting too early)
+        self._set_position(self._position_ms())
+        self._playback_state = new_state
+        self._progress_wake.set()
+
+    def track_playback_started(self, tl_track: Any) -> None:
+        self._cur_tl_track = tl_track
+        self._set_position(0)
+        self._progress_wake.set()
+
+    def track_playback_paused(self, tl_track: Any, time_position: int) -> None:
+        self._cur_tl_track = tl_track
+        self._set_position(time_position)
+        self._progress_wake.set()
+
+    def track_playback_resumed(self, tl_track: Any, time_position: int) -> None:
+        self._cur_tl_track = tl_track
+        self._set_position(time_position)
+        self._progress_wake.set()
+
+    def track_playback_ended(self, tl_track: Any, time_position: int) -> None:
+        # Drop the finished track; the next track_playback_started sets a new one
+        if self._cur_tl_track == tl_track:
+            self._cur_tl_track = None
+
+    def seeked(self, time_position: int) -> None:
+        self._set_position(time_position)
+        self._progress_wake.set()
+
+    def _set_position(self, time_position: int) -> None:
+        self._pos_anchor = (int(time_position), time.monotonic())
+
+    def _position_ms(self) -> int:
+        """Current track position, extrapolated from the last core event while playing."""
+        pos_ms, at = self._pos_anchor
+        if self._playback_state == "playing":
+            pos_ms += int((time.monotonic() - at) * 1000)
+        return pos_ms
+
     # --- Mapping helper methods (callable via actor proxy) ---
     def get_mapping(self, tag: str) -> Optional[str]:
+        try:
+            return self._mappings[tag]
+        except KeyError:
+            pass
+        # Not seen at startup: the row may have been written to the DB directly
         mapping = self._db.get(tag)
-        if mapping:
-            return mapping.get("uri")
-        return self._config_mappings.get(tag)
+        uri = mapping.get("uri") if mapping else None
+        with self._mappings_lock:
+            # A set_mapping/delete_mapping that ran during the DB read wins
+            return self._mappings.setdefault(tag, uri)
 
-    def set_mapping(self, tag: str, uri: str, description: str = "") -> None:
-        self._db.set(tag, uri, description)
+    def set_mapping(self, tag: str, uri: str, description: str = "") -> bool:
+        if not self._db.set(tag, uri, description):
+            return False
+        with self._mappings_lock:
+            self._mappings[tag] = uri
+        self._invalidate_tag_action(tag)
+        return True
 
     def delete_mapping(self, tag: str) -> bool:
-        return self._db.delete(tag)
+        deleted = self._db.delete(tag)
+        with self._mappings_lock:
+            # Fall back to the config mapping, if any, like a fresh lookup would
+            self._mappings[tag] = self._config_mappings.get(tag)
+        self._invalidate_tag_action(tag)
+        return deleted
 
     def list_mappings(self) -> Dict[str, Dict[str, str]]:
-        out = self._db.list_all()
-        # Merge config mappings where DB doesn't have them
-        for k, v in self._config_mappings.items():
-            if k not in out:
-                out[k] = {"uri": v, "description": ""}
+        out = dict(self._config_baseline)
+        out.update(self._db.list_all())
         return out
 
-    def get_led_manager(self) -> Optional[LEDManager]:
+    def invalidate_config_cache(self) -> None:
+        """Reload sound and LED settings after they were edited (e.g. from the Web UI)."""
+        self._sounds.reload()
+        self._led_cfg.reload()
+        self._cache_config()
+        # The progress thread re-reads the remaining flag when woken
+        self._progress_wake.set()
+
+    def _cache_config(self) -> None:
+        self._welcome_uri: Optional[str] = self._sounds.get("welcome") or None
+        self._farewell_uri: Optional[str] = self._sounds.get("farewell") or None
+        self._detected_uri: Optional[str] = self._sounds.get("detected") or None
+        self._cfg_welcome = bool(self._led_cfg.get("welcome"))
+        self._cfg_farewell = bool(self._led_cfg.get("farewell"))
+        self._cfg_remaining = bool(self._led_cfg.get("remaining"))
+
+    def get_led_manager(self) -> Optional["LEDManager"]:
         """Return the LED manager instance."""
         return self._led
 
+    def ping(self) -> bool:
+        """Cheap liveness check for the Web UI status endpoint."""
+        return True
+
     # --- LED brightness management (persist + apply) ---
     def set_led_brightness(self, value: int) -> bool:
         try:
@@ -500,14 +777,8 @@ class RFIDFrontend(_BaseClass):
 
     def reset_led_brightness_to_conf(self) -> Dict[str, int]:
         """Reset LED brightness values to conf defaults and persist."""
-        try:
-            b = int(self._config.get("led_brightness", 60))
-        except Exception:
-            b = 60
-        try:
-            ib = int(self._config.get("led_idle_brightness", 10))
-        except Exception:
-            ib = 10
+        b = self._cfg.led_brightness
+        ib = self._cfg.led_idle_brightness
         try:
             self.set_led_brightness(b)
         except Exception:
@@ -518,113 +789,103 @@ class RFIDFrontend(_BaseClass):
             pass
         return {"brightness": b, "idle_brightness": ib}
 
-    # --- Tag handling ---
-    def _play_detect_then_execute(self, mapped_uri: str) -> None:
-        """Queue detected sound first, then mapped content, and start playback once."""
-        if self.core is None:
-            logger.warning("Core not available; cannot execute mapping")
+    # --- Sounds ---
+    def _play_sound(self, key: str, uri: Optional[str]) -> None:
+        """Replace the tracklist with the ``key`` sound at ``uri`` and play it."""
+        if not uri or self.core is None:
             return
         try:
-            uri_det = self._sounds.get("detected")
-        except Exception:
-            uri_det = ""
-        try:
-            # Handle special commands first BEFORE clearing tracklist
-            if mapped_uri == "TOGGLE_PLAY":
-                # Toggle current playback state without adding detected sound or clearing tracklist
-                state = self.core.playback.get_state().get()
-                logger.info("RFIDFrontend: TOGGLE_PLAY - current state: %s", state)
-                if state == "playing":
-                    self.core.playback.pause().get()
-                    logger.info("RFIDFrontend: paused playback")
-                elif state == "paused":
-                    self.core.playback.resume().get()
-                    logger.info("RFIDFrontend: resumed playback")
-                else:
-                    # If stopped, start playing current tracklist
-                    self.core.playback.play().get()
-                    logger.info("RFIDFrontend: started playback from stopped")
-                return
-            
-            # For all other actions, clear tracklist
-            self.core.tracklist.clear().get()
-            if mapped_uri == "STOP":
-                # Stop playback immediately; don't queue detected sound
-                self.core.playback.stop().get()
-                return
+            logger.info("RFIDFrontend: playing %s sound: %s", key, uri)
+            self._replace_and_play([uri])
+        except Exception:
+            logger.exception("RFIDFrontend: failed to play %s sound", key)
+
+    # --- Tag handling ---
+    def _toggle_play(self) -> None:
+        """Toggle current playback state without touching the tracklist.
+
+        The state comes from core events, so nothing is awaited; the command is
+        queued on the core actor without blocking the RFID thread.
+        """
+        state = self._playback_state
+        logger.info("RFIDFrontend: TOGGLE_PLAY - current state: %s", state)
+        if state == "playing":
+            self.core.playback.pause()
+            logger.info("RFIDFrontend: paused playback")
+        elif state == "paused":
+            self.core.playback.resume()
+            logger.info("RFIDFrontend: resumed playback")
+        else:
+            # If stopped, start playing current tracklist
+            self.core.playback.play()
+            logger.info("RFIDFrontend: started playback from stopped")
+
+    def _stop_playback(self) -> None:
+        """Clear the tracklist and stop playback immediately."""
+        self.core.tracklist.clear()
+        self.core.playback.stop().get()
+
+    # Special mapping values that are commands rather than URIs: value -> (UI action, handler)
+    _COMMANDS = {
+        "TOGGLE_PLAY": ("toggle", _toggle_play),
+        "STOP": ("stop", _stop_playback),
+    }
+
+    def _tag_action(self, tag: str) -> _TagAction:
+        """Return the resolved action for ``tag``, resolving and caching it on first scan."""
+        with self._tag_actions_lock:
+            tag_action = self._tag_actions.get(tag)
+            if tag_action is None:
+                tag_action = self._resolve_tag_action(tag)
+                self._tag_actions[tag] = tag_action
+            return tag_action
+
+    def _resolve_tag_action(self, tag: str) -> _TagAction:
+        uri = self.get_mapping(tag)
+        if not uri:
+            return _NO_ACTION
+        command = self._COMMANDS.get(uri)
+        if command is not None:
+            action, handler = command
+            return _TagAction(uri, action, functools.partial(handler, self))
+        return _TagAction(uri, "play", functools.partial(self._queue_uri, uri, prepend_detected=True))
+
+    def _invalidate_tag_action(self, tag: str) -> None:
+        with self._tag_actions_lock:
+            self._tag_actions.pop(tag, None)
+
+    def _queue_uri(self, uri: str, *, prepend_detected: bool) -> None:
+        """Replace the tracklist with ``uri`` (optionally after the detected sound) and play."""
+        try:
+            logger.info("RFIDFrontend: queue mapped content: %s", uri)
+            uris = self._expand_uri(uri)
             # Add detected sound first if configured
-            if uri_det:
-                logger.info("RFIDFrontend: queue detected sound: %s", uri_det)
-                self.core.tracklist.add(uris=[uri_det]).get()
-            # Add mapped content
-            logger.info("RFIDFrontend: queue mapped content: %s", mapped_uri)
-            # Expand albums/playlists
-            if mapped_uri.startswith('spotify:album:') or ':album:' in mapped_uri:
-                lookup_result = self.core.library.lookup(uris=[mapped_uri]).get()
-                tracks = lookup_result.get(mapped_uri) if lookup_result else None
-                if tracks:
-                    for track in tracks:
-                        self.core.tracklist.add(uris=[track.uri]).get()
-                else:
-                    self.core.tracklist.add(uris=[mapped_uri]).get()
-            elif mapped_uri.startswith('spotify:playlist:') or ':playlist:' in mapped_uri:
-                lookup_result = self.core.library.lookup(uris=[mapped_uri]).get()
-                tracks = lookup_result.get(mapped_uri) if lookup_result else None
-                if tracks:
-                    for track in tracks:
-                        self.core.tracklist.add(uris=[track.uri]).get()
-                else:
-                    self.core.tracklist.add(uris=[mapped_uri]).get()
-            else:
-                self.core.tracklist.add(uris=[mapped_uri]).get()
+            if prepend_detected and self._detected_uri:
+                logger.info("RFIDFrontend: queue detected sound: %s", self._detected_uri)
+                uris.insert(0, self._detected_uri)
             # Start playback once; Mopidy will play detected then continue to mapped
-            self.core.playback.play().get()
+            self._replace_and_play(uris)
         except Exception:
-            logger.exception("RFIDFrontend: queue detected+mapped failed")
+            logger.exception("RFIDFrontend: failed to queue %s", uri)
 
-    def _execute_mapping(self, uri: str) -> None:
-        """Execute a mapping URI: handle special commands and URI types."""
-        if self.core is None:
-            logger.warning("Core not available; cannot execute mapping")
-            return
-        if uri == "TOGGLE_PLAY":
-            if self.core.playback.get_state().get() == "playing":
-                self.core.playback.pause().get()
-            else:
-                self.core.playback.play().get()
-            return
-        if uri == "STOP":
-            self.core.playback.stop().get()
-            return
-        logger.info("RFIDFrontend: adding URI to tracklist: %s", uri)
-        self.core.tracklist.clear().get()
-        # Handle albums/playlists vs tracks
-        if uri.startswith('spotify:album:') or ':album:' in uri:
-            lookup_result = self.core.library.lookup(uris=[uri]).get()
-            if lookup_result and uri in lookup_result:
-                tracks = lookup_result[uri]
-                if tracks:
-                    for track in tracks:
-                        self.core.tracklist.add(uris=[track.uri]).get()
-                else:
-                    logger.warning("Album has no tracks: %s", uri)
-            else:
-                self.core.tracklist.add(uris=[uri]).get()
-        elif uri.startswith('spotify:playlist:') or ':playlist:' in uri:
-            lookup_result = self.core.library.lookup(uris=[uri]).get()
-            if lookup_result and uri in lookup_result:
-                tracks = lookup_result[uri]
-                if tracks:
-                    for track in tracks:
-                        self.core.tracklist.add(uris=[track.uri]).get()
-                else:
-                    logger.warning("Playlist has no tracks: %s", uri)
-            else:
-                self.core.tracklist.add(uris=[uri]).get()
-        else:
-            self.core.tracklist.add(uris=[uri]).get()
+    def _replace_and_play(self, uris: List[str]) -> None:
+        """Replace the tracklist with ``uris`` and start playback."""
+        # Core actor handles messages in order; only wait for the final call
+        self.core.tracklist.clear()
+        self.core.tracklist.add(uris=uris)
         self.core.playback.play().get()
 
+    def _expand_uri(self, uri: str) -> List[str]:
+        """Return the URIs to queue for ``uri``, expanding albums/playlists into their tracks."""
+        kind = _uri_kind(uri)
+        if kind:
+            lookup_result = self.core.library.lookup(uris=[uri]).get()
+            tracks = lookup_result.get(uri) if lookup_result else None
+            if tracks:
+                return [t.uri for t in tracks]
+            logger.warning("%s lookup returned no tracks, queueing URI as is: %s", kind.capitalize(), uri)
+        return [uri]
+
     def _on_tag_detected(self, tag_id: int) -> None:
         """Handle tag detection: map tag -> URI or special commands.
 
@@ -637,65 +898,33 @@ class RFIDFrontend(_BaseClass):
         logger.info("RFIDFrontend: tag detected: %s", tag_str)
         
         # Determine mapping first to decide confirmation behavior
-        mapped_uri = self.get_mapping(tag_str)
+        tag_action = self._tag_action(tag_str)
+        mapped_uri = tag_action.uri
         
-        # LED detected confirm (yellow if BT audio connected — cached at startup)
+        # Web UI event and LED flash are both handed off to other threads, so start
+        # them before any core round trip
+        self._broadcast({
+            "event": "tag_scanned",
+            "tag_id": tag_str,
+            "uri": mapped_uri,
+            "action": tag_action.action,
+        })
+
+        # LED detected confirm (yellow if BT audio connected — kept current by the pactl watcher)
+        led = self._led
         try:
-            if self._led and getattr(self._led, '_enabled', False):
-                col = (255, 255, 0) if self._bt_connected else (0, 255, 0)
-                self._led.flash_confirm(color=col)
+            if led is not None and self._led_enabled:
+                col = _COLOR_YELLOW if self._bt_connected else _COLOR_GREEN
+                led.flash_confirm(color=col)
         except Exception:
             logger.exception("LED flash failed")
-        
-        # Remaining track animation hook (optional)
-        try:
-            if self._led and self._led_cfg.get("remaining"):
-                state = self.core.playback.get_state().get() if self.core else None
-                if state == "playing":
-                    pass
-        except Exception:
-            logger.exception("LED remaining animation hook failed")
-        
-        # Play detected sound (confirmation) only when no mapping exists to avoid playback race
-        try:
-            if not mapped_uri:
-                uri_det = self._sounds.get("detected")
-                if uri_det and self.core is not None:
-                    logger.info("RFIDFrontend: playing detected sound: %s", uri_det)
-                    self.core.tracklist.clear().get()
-                    self.core.tracklist.add(uris=[uri_det]).get()
-                    self.core.playback.play().get()
-        except Exception:
-            logger.exception("RFIDFrontend: failed to play detected sound")
 
-        # Broadcast tag event to Web UI
-        def _broadcast():
-            try:
-                from . import http
-                # determine action for UI
-                if mapped_uri:
-                    if mapped_uri == "TOGGLE_PLAY":
-                        action = "toggle"
-                    elif mapped_uri == "STOP":
-                        action = "stop"
-                    else:
-                        action = "play"
-                else:
-                    action = "none"
-                http.broadcast_event({
-                    "event": "tag_scanned",
-                    "tag_id": tag_str,
-                    "uri": mapped_uri or "",
-                    "action": action,
-                })
-                logger.info("RFIDFrontend: broadcasted tag_scanned event for tag %s (action=%s)", tag_str, action)
-            except Exception:
-                logger.exception("Failed to broadcast tag event")
-        threading.Thread(target=_broadcast, daemon=True).start()
+        # Play detected sound (confirmation) only when no mapping exists to avoid playback race
+        if not mapped_uri and self._detected_uri:
+            self._play_sound("detected", self._detected_uri)
 
         # Execute mapping if present
-        uri = mapped_uri
-        if not uri:
+        if tag_action.run is None:
             logger.warning("No mapping found for tag %s", tag_str)
             return
         
@@ -705,12 +934,100 @@ class RFIDFrontend(_BaseClass):
         
         # Play detected sound together with blink, then continue to mapped track
         try:
-            self._play_detect_then_execute(uri)
+            tag_action.run()
         except Exception:
             logger.exception("RFIDFrontend: failed detected-then-execute flow")
 
+    # --- Web UI broadcasting ---
+    def _broadcast(self, event: Dict[str, Any]) -> None:
+        """Send an event to the Web UI; delivery is scheduled on Tornado's IOLoop."""
+        if self._http is None:
+            return
+        try:
+            self._http.broadcast_event(event)
+            logger.info(
+                "RFIDFrontend: broadcasted %s event for tag %s (action=%s)",
+                event.get("event"), event.get("tag_id"), event.get("action"),
+            )
+        except Exception:
+            logger.exception("Failed to broadcast tag event")
+
     # --- Bluetooth audio detection ---
+    def _start_bt_watcher(self) -> None:
+        """Follow PulseAudio sink changes so ``_bt_connected`` updates without polling."""
+        import shutil
+        import subprocess
+
+        if not shutil.which("pactl"):
+            return
+        try:
+            proc = subprocess.Popen(
+                ["pactl", "subscribe"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+            )
+        except Exception:
+            logger.exception("RFIDFrontend: failed to start pactl subscribe")
+            return
+        stdout = proc.stdout
+        if stdout is None:
+            logger.error("RFIDFrontend: pactl subscribe has no output pipe")
+            proc.terminate()
+            return
+        self._pactl_proc = proc
+
+        def _run() -> None:
+            try:
+                for line in stdout:
+                    # The event only names the sink index; re-check what is connected now
+                    if _PACTL_SINK_EVENT.search(line):
+                        self._bt_connected = self._check_bluetooth_audio()
+                        logger.debug("RFIDFrontend: BT audio connected: %s", self._bt_connected)
+            except Exception:
+                # Reading fails once _stop_bt_watcher closes the pipe; only report it otherwise
+                if self._pactl_proc is proc:
+                    logger.exception("RFIDFrontend: pactl subscribe watcher failed")
+
+        threading.Thread(target=_run, name="bt-watch", daemon=True).start()
+
+    def _stop_bt_watcher(self) -> None:
+        import subprocess
+
+        proc, self._pactl_proc = self._pactl_proc, None
+        if proc is None:
+            return
+        try:
+            proc.terminate()
+            try:
+                proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait(timeout=1)
+        except Exception:
+            logger.exception("RFIDFrontend: failed to stop pactl subscribe")
+        finally:
+            # Ends the watcher thread's read loop and releases the pipe
+            if proc.stdout is not None:
+                try:
+                    proc.stdout.close()
+                except Exception:
+                    pass
+
     def _is_bluetooth_audio_connected(self) -> bool:
+        """Bluetooth audio status, re-checked at most every ``_BT_CACHE_TTL`` seconds."""
+        proc = self._pactl_proc
+        if proc is not None and proc.poll() is None:
+            # Watcher is live and keeps the flag current
+            return self._bt_connected
+        now = time.monotonic()
+        if now - self._bt_cache_ts >= _BT_CACHE_TTL:
+            self._bt_cache_val = self._check_bluetooth_audio()
+            self._bt_cache_ts = now
+        return self._bt_cache_val
+
+    def _check_bluetooth_audio(self) -> bool:
         """Detect if a Bluetooth audio device is connected.
 
         Strategy:
@@ -725,7 +1042,9 @@ class RFIDFrontend(_BaseClass):
             # 1) PulseAudio sinks (works on PulseAudio/PipeWire setups)
             if shutil.which("pactl"):
                 try:
-                    out = subprocess.check_output(["pactl", "list", "sinks", "short"], text=True)
+                    out = subprocess.check_output(
+                        ["pactl", "list", "sinks", "short"], text=True, timeout=_BT_CMD_TIMEOUT
+                    )
                     for line in out.splitlines():
                         ln = line.lower()
                         if "bluez" in ln or "a2dp" in ln or "bluetooth" in ln:
@@ -736,7 +1055,9 @@ class RFIDFrontend(_BaseClass):
             # 2) bluetoothctl (DietPi/ALSA + BlueALSA commonly relies on this)
             if shutil.which("bluetoothctl"):
                 try:
-                    devs = subprocess.check_output(["bluetoothctl", "devices"], text=True)
+                    devs = subprocess.check_output(
+                        ["bluetoothctl", "devices"], text=True, timeout=_BT_CMD_TIMEOUT
+                    )
                     macs = []
                     for ln in devs.splitlines():
                         parts = ln.strip().split()
@@ -745,7 +1066,9 @@ class RFIDFrontend(_BaseClass):
                             macs.append(parts[1])
                     for mac in macs:
                         try:
-                            info = subprocess.check_output(["bluetoothctl", "info", mac], text=True)
+                            info = subprocess.check_output(
+                                ["bluetoothctl", "info", mac], text=True, timeout=_BT_CMD_TIMEOUT
+                            )
                             infol = info.lower()
                             connected = "connected: yes" in infol
                             # Check Audio Sink UUID presence when possible
@@ -6,6 +6,13 @@ import os
 import time
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used without it
+    orjson = None  # type: ignore
+
+import tornado.ioloop
+import tornado.iostream
 import tornado.web
 import tornado.websocket
 
@@ -20,6 +27,63 @@ _io_loop = None  # type: ignore
 LAST_SCAN: dict[str, Any] | None = None
 
 
+
+def _json_bytes(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(body: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body.decode("utf-8"))
+
+
+def _write_json(handler: tornado.web.RequestHandler, payload: bytes) -> None:
+    """Send pre-encoded JSON, skipping Tornado's per-request json.dumps of a dict."""
+    handler.set_header("Content-Type", "application/json; charset=UTF-8")
+    handler.write(payload)
+
+
+class _MappingsSnapshot:
+    """frontend.list_mappings(), filled on first GET and kept current on writes."""
+
+    def __init__(self) -> None:
+        self.mappings: dict[str, dict[str, str]] | None = None
+        # The same snapshot encoded once for GET responses
+        self.json: bytes | None = None
+
+
+_mappings_snapshot = _MappingsSnapshot()
+
+
+def _set_mappings_cache(mappings: dict[str, dict[str, str]] | None) -> None:
+    _mappings_snapshot.mappings = mappings
+    _mappings_snapshot.json = None
+
+
+async def _resolve(future: Any) -> Any:
+    """Wait for a Pykka future in a worker thread so the IOLoop keeps serving clients."""
+    return await tornado.ioloop.IOLoop.current().run_in_executor(None, future.get)
+
+
+async def _get_mappings(frontend: Any) -> dict[str, dict[str, str]]:
+    mappings = _mappings_snapshot.mappings
+    if mappings is None:
+        mappings = await _resolve(frontend.proxy().list_mappings()) or {}
+        _set_mappings_cache(mappings)
+    return mappings
+
+
+async def _get_mappings_json(frontend: Any) -> bytes:
+    mappings = await _get_mappings(frontend)
+    payload = _mappings_snapshot.json
+    if payload is None:
+        payload = _mappings_snapshot.json = _json_bytes(mappings)
+    return payload
+
+
 class MappingsHandler(tornado.web.RequestHandler):
     def initialize(self, frontend: Any):
         self.frontend = frontend
@@ -31,8 +95,7 @@ class MappingsHandler(tornado.web.RequestHandler):
                 self.set_status(503)
                 self.write({"error": "frontend not available"})
                 return
-            mappings = self.frontend.proxy().list_mappings().get()
-            self.write(mappings)
+            _write_json(self, await _get_mappings_json(self.frontend))
         except Exception:
             logger.exception("http: list mappings failed")
             self.set_status(500)
@@ -45,16 +108,23 @@ class MappingsHandler(tornado.web.RequestHandler):
                 self.set_status(503)
                 self.write({"ok": False, "error": "frontend not available"})
                 return
-            data = json.loads(self.request.body.decode("utf-8"))
+            data = _json_loads(self.request.body)
             tag = str(data.get("tag", "")).strip()
             uri = str(data.get("uri", "")).strip()
             description = str(data.get("description", "")).strip()
             logger.info("http: set mapping request tag=%s uri=%s", tag, uri)
             if not tag or not uri:
                 raise ValueError("missing tag or uri")
-            self.frontend.proxy().set_mapping(tag, uri, description).get()
-            # Broadcast update to all connected clients
-            broadcast_event({"event": "mappings_updated"})
+            # Waited for off the IOLoop; only a stored mapping is reported and broadcast
+            if not await _resolve(self.frontend.proxy().set_mapping(tag, uri, description)):
+                logger.error("http: mapping for tag %s was not stored", tag)
+                self.set_status(500)
+                self.write({"ok": False, "error": "mapping not stored"})
+                return
+            mappings = dict(await _get_mappings(self.frontend))
+            mappings[tag] = {"uri": uri, "description": description}
+            # Broadcast update (with the new snapshot) to all connected clients
+            broadcast_event({"event": "mappings_updated", "mappings": mappings})
             self.write({"ok": True})
         except Exception:
             logger.exception("http: set mapping failed")
@@ -73,7 +143,11 @@ class MappingDeleteHandler(tornado.web.RequestHandler):
                 self.set_status(503)
                 self.write({"ok": False, "error": "frontend not available"})
                 return
-            ok = self.frontend.proxy().delete_mapping(tag).get()
+            ok = await _resolve(self.frontend.proxy().delete_mapping(tag))
+            if ok:
+                # A config mapping for the tag may show through again, so re-read
+                _set_mappings_cache(None)
+                broadcast_event({"event": "mappings_updated", "mappings": await _get_mappings(self.frontend)})
             self.write({"ok": ok})
         except Exception:
             logger.exception("http: delete mapping failed")
@@ -81,12 +155,114 @@ class MappingDeleteHandler(tornado.web.RequestHandler):
             self.write({"ok": False})
 
 
+# Browse fan-out limits: top-level sources visited and items returned
+_BROWSE_MAX_SOURCES = 10
+_BROWSE_MAX_ITEMS = 200
+
+# Encoded browse/search responses, reused while the Web UI repeats a query
+_HTTP_CACHE_TTL = 30.0
+# Searches are keyed by the raw query, so cap how many distinct ones are kept
+_HTTP_CACHE_MAX = 64
+_http_cache: dict[str, tuple[float, bytes]] = {}
+
+
+def _cache_get(key: str) -> bytes | None:
+    entry = _http_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        del _http_cache[key]
+        return None
+    return entry[1]
+
+
+def _cache_put(key: str, obj: Any) -> bytes:
+    payload = _json_bytes(obj)
+    now = time.monotonic()
+    for k in [k for k, (expiry, _) in _http_cache.items() if expiry < now]:
+        del _http_cache[k]
+    # Re-insert so dict order stays oldest-first, then drop the oldest beyond the cap
+    _http_cache.pop(key, None)
+    _http_cache[key] = (now + _HTTP_CACHE_TTL, payload)
+    while len(_http_cache) > _HTTP_CACHE_MAX:
+        del _http_cache[next(iter(_http_cache))]
+    return payload
+
+
+def _get_all(futures: list[Any]) -> tuple[list[Any], bool]:
+    """Wait for a batch of Pykka futures.
+
+    A failed lookup yields an empty result; the flag tells whether any failed.
+    """
+    results = []
+    failed = False
+    for f in futures:
+        try:
+            results.append(f.get())
+        except Exception:
+            results.append([])
+            failed = True
+    return results, failed
+
+
 class BrowseHandler(tornado.web.RequestHandler):
     def initialize(self, core: Any):
         self.core = core
+        # Set when any browse call failed; partial results are served but not cached
+        self._browse_failed = False
+
+    async def _browse_all(self, uris: list[Any]) -> list[Any]:
+        """Browse several URIs at once, waiting off the IOLoop."""
+        futures = []
+        for uri in uris:
+            try:
+                futures.append(self.core.library.browse(uri=uri))
+            except Exception:
+                self._browse_failed = True
+        results, failed = await tornado.ioloop.IOLoop.current().run_in_executor(None, _get_all, futures)
+        if failed:
+            self._browse_failed = True
+        return results
+
+    async def _browse_library(self, item_type: str, deep_types: tuple[str, ...]) -> list[dict[str, str]]:
+        """Collect refs of ``item_type`` from each source and one level below it."""
+        items: list[dict[str, str]] = []
+
+        def add(ref: Any) -> None:
+            source = ref.uri.split(':')[0] if ':' in ref.uri else 'unknown'
+            items.append({
+                "uri": ref.uri,
+                "name": ref.name or f"Unknown {item_type.title()}",
+                "type": item_type,
+                "source": source
+            })
+
+        (roots,) = await self._browse_all([None])
+        sources = await self._browse_all([r.uri for r in roots[:_BROWSE_MAX_SOURCES]])
+        for sub_result in sources:
+            deep_uris = []
+            for item in sub_result:
+                if item.type == item_type:
+                    add(item)
+                elif item.type in deep_types:
+                    deep_uris.append(item.uri)
+                if len(items) >= _BROWSE_MAX_ITEMS:  # Limit to prevent timeout
+                    return items
+            for deep_result in await self._browse_all(deep_uris):
+                for deep_item in deep_result[:100]:
+                    if deep_item.type == item_type:
+                        add(deep_item)
+                if len(items) >= _BROWSE_MAX_ITEMS:
+                    return items
+        return items
 
     async def get(self):
         item_type = self.get_query_argument("type", default="track")
+        cache_key = f"browse:{item_type}"
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            _write_json(self, cached)
+            return
         try:
             items = []
             if self.core is not None:
@@ -95,7 +271,7 @@ class BrowseHandler(tornado.web.RequestHandler):
                     
                     if item_type == "playlist":
                         # Get playlists - most reliable
-                        playlists_result = self.core.playlists.as_list().get()
+                        playlists_result = await _resolve(self.core.playlists.as_list())
                         for pl in playlists_result:
                             # Extract source from URI (e.g., spotify:playlist:xxx -> spotify)
                             source = pl.uri.split(':')[0] if ':' in pl.uri else 'unknown'
@@ -108,80 +284,22 @@ class BrowseHandler(tornado.web.RequestHandler):
                         logger.info(f"http: found {len(items)} playlists")
                         
                     elif item_type == "album":
-                        # Get albums by browsing all sources
-                        browse_result = self.core.library.browse(uri=None).get()
-                        for ref in browse_result:
-                            try:
-                                # Browse each source
-                                sub_result = self.core.library.browse(uri=ref.uri).get()
-                                for item in sub_result:
-                                    if item.type == "album":
-                                        source = item.uri.split(':')[0] if ':' in item.uri else 'unknown'
-                                        items.append({
-                                            "uri": item.uri,
-                                            "name": item.name or "Unknown Album",
-                                            "type": "album",
-                                            "source": source
-                                        })
-                                    # Also check directories for albums
-                                    elif item.type == "directory":
-                                        try:
-                                            deep_result = self.core.library.browse(uri=item.uri).get()
-                                            for deep_item in deep_result[:100]:
-                                                if deep_item.type == "album":
-                                                    source = deep_item.uri.split(':')[0] if ':' in deep_item.uri else 'unknown'
-                                                    items.append({
-                                                        "uri": deep_item.uri,
-                                                        "name": deep_item.name or "Unknown Album",
-                                                        "type": "album",
-                                                        "source": source
-                                                    })
-                                        except Exception:
-                                            pass
-                                    if len(items) >= 200:  # Limit to prevent timeout
-                                        break
-                            except Exception:
-                                continue
+                        # Albums directly under each source, or one directory deeper
+                        items = await self._browse_library("album", ("directory",))
                         logger.info(f"http: found {len(items)} albums")
                         
                     elif item_type == "track":
-                        # Get tracks by browsing
-                        browse_result = self.core.library.browse(uri=None).get()
-                        for ref in browse_result:
-                            try:
-                                sub_result = self.core.library.browse(uri=ref.uri).get()
-                                for item in sub_result:
-                                    if item.type == "track":
-                                        source = item.uri.split(':')[0] if ':' in item.uri else 'unknown'
-                                        items.append({
-                                            "uri": item.uri,
-                                            "name": item.name or "Unknown Track",
-                                            "type": "track",
-                                            "source": source
-                                        })
-                                    # Browse deeper for tracks
-                                    elif item.type in ("directory", "album"):
-                                        try:
-                                            deep_result = self.core.library.browse(uri=item.uri).get()
-                                            for deep_item in deep_result[:100]:
-                                                if deep_item.type == "track":
-                                                    source = deep_item.uri.split(':')[0] if ':' in deep_item.uri else 'unknown'
-                                                    items.append({
-                                                        "uri": deep_item.uri,
-                                                        "name": deep_item.name or "Unknown Track",
-                                                        "type": "track",
-                                                        "source": source
-                                                    })
-                                        except Exception:
-                                            pass
-                                    if len(items) >= 200:
-                                        break
-                            except Exception:
-                                continue
+                        # Tracks directly under each source, or inside a directory/album
+                        items = await self._browse_library("track", ("directory", "album"))
                         logger.info(f"http: found {len(items)} tracks")
                         
                 except Exception:
                     logger.exception("http: Mopidy library browse failed")
+                else:
+                    # Only complete results are worth reusing
+                    if not self._browse_failed:
+                        _write_json(self, _cache_put(cache_key, {"items": items}))
+                        return
             
             self.write({"items": items})
         except Exception:
@@ -190,6 +308,12 @@ class BrowseHandler(tornado.web.RequestHandler):
             self.write({"items": []})
 
 
+def _artist_names(artists: Any) -> str:
+    if not artists:
+        return ""
+    return ", ".join(getattr(a, "name", None) or "" for a in artists)
+
+
 class SearchHandler(tornado.web.RequestHandler):
     def initialize(self, core: Any):
         self.core = core
@@ -199,11 +323,16 @@ class SearchHandler(tornado.web.RequestHandler):
         if not q:
             self.write({"results": []})
             return
+        cache_key = f"search:{q}"
+        cached = _cache_get(cache_key)
+        if cached is not None:
+            _write_json(self, cached)
+            return
         try:
             results = []
             if self.core is not None:
                 try:
-                    search_result = self.core.library.search({"any": [q]}).get()
+                    search_result = await _resolve(self.core.library.search({"any": [q]}))
                     if search_result:
                         for result in search_result:
                             # Add tracks
@@ -212,7 +341,7 @@ class SearchHandler(tornado.web.RequestHandler):
                                 for t in tracks:
                                     name = getattr(t, "name", None) or "Unknown"
                                     artists = getattr(t, "artists", None)
-                                    artist_str = ", ".join([getattr(a, "name", "") for a in artists]) if artists else ""
+                                    artist_str = _artist_names(artists)
                                     results.append({
                                         "uri": getattr(t, "uri", ""), 
                                         "name": f"{name} - {artist_str}" if artist_str else name,
@@ -225,7 +354,7 @@ class SearchHandler(tornado.web.RequestHandler):
                                 for a in albums:
                                     name = getattr(a, "name", None) or "Unknown Album"
                                     artists = getattr(a, "artists", None)
-                                    artist_str = ", ".join([getattr(ar, "name", "") for ar in artists]) if artists else ""
+                                    artist_str = _artist_names(artists)
                                     results.append({
                                         "uri": getattr(a, "uri", ""),
                                         "name": f"{name} - {artist_str}" if artist_str else name,
@@ -243,6 +372,9 @@ class SearchHandler(tornado.web.RequestHandler):
                                     })
                 except Exception:
                     logger.exception("http: Mopidy library search failed")
+                else:
+                    _write_json(self, _cache_put(cache_key, {"results": results}))
+                    return
             self.write({"results": results})
         except Exception:
             logger.exception("http: search handler failed")
@@ -250,11 +382,21 @@ class SearchHandler(tornado.web.RequestHandler):
             self.write({"results": []})
 
 
+# Outbound bytes queued per WebSocket client before it is dropped as too slow
+_WS_MAX_WRITE_BUFFER = 1024 * 1024
+
+
 class WSHandler(tornado.websocket.WebSocketHandler):
     clients: set[WSHandler] = set()
 
     def open(self, *args, **kwargs):
         logger.debug("websocket: client connected")
+        # Events are small; send them without waiting to coalesce
+        self.set_nodelay(True)
+        # ws_connection is Optional in Tornado's typing; it is set by the time open() runs
+        stream = getattr(self.ws_connection, "stream", None)
+        if stream is not None:
+            stream.max_write_buffer_size = _WS_MAX_WRITE_BUFFER
         self.clients.add(self)
 
     def on_close(self):
@@ -264,12 +406,23 @@ class WSHandler(tornado.websocket.WebSocketHandler):
     def check_origin(self, origin: str) -> bool:
         return True
 
+    def get_compression_options(self) -> dict[str, Any]:
+        # permessage-deflate; mapping lists are repetitive JSON, and a low level keeps CPU cheap
+        return {"compression_level": 1, "mem_level": 5}
+
     @classmethod
     def broadcast(cls, obj: Any) -> None:
-        msg = json.dumps(obj)
+        # Encode once; Tornado sends bytes unchanged as a text frame when binary=False
+        msg = _json_bytes(obj)
         for c in list(cls.clients):
             try:
-                c.write_message(msg)
+                c.write_message(msg, binary=False)
+            except tornado.websocket.WebSocketClosedError:
+                cls.clients.discard(c)
+            except tornado.iostream.StreamBufferFullError:
+                logger.warning("websocket: dropping client that is not reading")
+                cls.clients.discard(c)
+                c.close()
             except Exception:
                 logger.exception("websocket: failed to write message")
 
@@ -280,9 +433,20 @@ class LastScanHandler(tornado.web.RequestHandler):
         self.write(LAST_SCAN or {})
 
 
+def _notify_config_changed(frontend: Any) -> None:
+    """Tell the frontend to drop its cached sound/LED settings (fire-and-forget)."""
+    if frontend is None:
+        return
+    try:
+        frontend.proxy().invalidate_config_cache()
+    except Exception:
+        logger.exception("http: failed to notify frontend of config change")
+
+
 class SoundsHandler(tornado.web.RequestHandler):
-    def initialize(self, config: Any, core: Any):
+    def initialize(self, config: Any, core: Any, frontend: Any = None):
         self.core = core
+        self.frontend = frontend
         self.sounds = SoundsConfig()
 
     async def get(self):
@@ -295,7 +459,7 @@ class SoundsHandler(tornado.web.RequestHandler):
 
     async def post(self):
         try:
-            data = json.loads(self.request.body.decode("utf-8"))
+            data = _json_loads(self.request.body)
             key = str(data.get("key", ""))
             uri = str(data.get("uri", ""))
             if key not in ("welcome", "farewell", "detected"):
@@ -303,6 +467,7 @@ class SoundsHandler(tornado.web.RequestHandler):
                 self.write({"ok": False, "error": "invalid key"})
                 return
             self.sounds.set(key, uri)
+            _notify_config_changed(self.frontend)
             self.write({"ok": True})
         except Exception:
             logger.exception("http: set sounds failed")
@@ -311,7 +476,8 @@ class SoundsHandler(tornado.web.RequestHandler):
 
 
 class LedSettingsHandler(tornado.web.RequestHandler):
-    def initialize(self):
+    def initialize(self, frontend: Any = None):
+        self.frontend = frontend
         self.led_cfg = LedConfig()
 
     async def get(self):
@@ -324,7 +490,7 @@ class LedSettingsHandler(tornado.web.RequestHandler):
 
     async def post(self):
         try:
-            data = json.loads(self.request.body.decode("utf-8"))
+            data = _json_loads(self.request.body)
             key = str(data.get("key", ""))
             value = bool(data.get("value", False))
             if key not in ("welcome", "farewell", "remaining"):
@@ -332,6 +498,7 @@ class LedSettingsHandler(tornado.web.RequestHandler):
                 self.write({"ok": False, "error": "invalid key"})
                 return
             self.led_cfg.set(key, value)
+            _notify_config_changed(self.frontend)
             self.write({"ok": True})
         except Exception:
             logger.exception("http: set led settings failed")
@@ -350,8 +517,11 @@ class LedBrightnessHandler(tornado.web.RequestHandler):
                 self.write({"brightness": 60, "idle_brightness": 10, "error": "frontend not available"})
                 return
             proxy = self.frontend.proxy()
-            brightness = proxy.get_led_brightness().get()
-            idle_brightness = proxy.get_led_idle_brightness().get()
+            # Both requests queue on the actor before the first wait
+            brightness_f = proxy.get_led_brightness()
+            idle_f = proxy.get_led_idle_brightness()
+            brightness = await _resolve(brightness_f)
+            idle_brightness = await _resolve(idle_f)
             self.write({"brightness": brightness, "idle_brightness": idle_brightness})
         except Exception:
             logger.exception("http: get led brightness failed")
@@ -364,7 +534,7 @@ class LedBrightnessHandler(tornado.web.RequestHandler):
                 self.set_status(503)
                 self.write({"ok": False, "error": "frontend not available"})
                 return
-            data = json.loads(self.request.body.decode("utf-8"))
+            data = _json_loads(self.request.body)
             brightness = data.get("brightness")
             idle_brightness = data.get("idle_brightness")
             reset = bool(data.get("reset", False))
@@ -372,7 +542,7 @@ class LedBrightnessHandler(tornado.web.RequestHandler):
             proxy = self.frontend.proxy()
             if reset:
                 try:
-                    vals = proxy.reset_led_brightness_to_conf().get()
+                    vals = await _resolve(proxy.reset_led_brightness_to_conf())
                     result.update(vals)
                     result["brightness_ok"] = True
                     result["idle_brightness_ok"] = True
@@ -384,7 +554,7 @@ class LedBrightnessHandler(tornado.web.RequestHandler):
             if brightness is not None:
                 try:
                     bval = max(0, min(255, int(brightness)))
-                    success = proxy.set_led_brightness(bval).get()
+                    success = await _resolve(proxy.set_led_brightness(bval))
                     result["brightness"] = bval
                     result["brightness_ok"] = bool(success)
                 except Exception:
@@ -392,7 +562,7 @@ class LedBrightnessHandler(tornado.web.RequestHandler):
             if idle_brightness is not None:
                 try:
                     ival = max(0, min(255, int(idle_brightness)))
-                    success = proxy.set_led_idle_brightness(ival).get()
+                    success = await _resolve(proxy.set_led_idle_brightness(ival))
                     result["idle_brightness"] = ival
                     result["idle_brightness_ok"] = bool(success)
                 except Exception:
@@ -413,10 +583,9 @@ class StatusHandler(tornado.web.RequestHandler):
             reader = "unknown"
             if self.frontend is not None:
                 try:
-                    # Ask actor for a simple flag by checking private attr via proxy
-                    info = self.frontend.proxy().list_mappings().get()  # ping actor
-                    # If actor responsive, infer availability by checking an attribute
-                    # We cannot access private _rfid via proxy, so expose approximate status
+                    # If the actor responds, report the reader as available; the private
+                    # _rfid can't be read via proxy, so this is an approximate status
+                    await _resolve(self.frontend.proxy().ping())
                     reader = "available"
                 except Exception:
                     reader = "unavailable"
@@ -439,12 +608,11 @@ def factory(config: Any, core: Any) -> list[tuple[str, Any, dict]]:
     frontend = None
     try:
         import pykka
-        for actor_ref in pykka.ActorRegistry.get_all():
-            # Check actor class name instead of isinstance
-            if actor_ref.actor_class.__name__ == 'RFIDFrontend':
-                frontend = actor_ref
-                logger.info("http: Found RFIDFrontend actor")
-                break
+        # Look up by class name instead of isinstance
+        refs = pykka.ActorRegistry.get_by_class_name("RFIDFrontend")
+        if refs:
+            frontend = refs[0]
+            logger.info("http: Found RFIDFrontend actor")
         if not frontend:
             logger.warning("http: RFIDFrontend actor not found in registry")
     except Exception:
@@ -468,8 +636,8 @@ def factory(config: Any, core: Any) -> list[tuple[str, Any, dict]]:
         (r"/api/search", SearchHandler, {"core": core}),
         (r"/api/browse", BrowseHandler, {"core": core}),
         (r"/api/last-scan", LastScanHandler, {}),
-        (r"/api/sounds", SoundsHandler, {"config": config, "core": core}),
-        (r"/api/led-settings", LedSettingsHandler, {}),
+        (r"/api/sounds", SoundsHandler, {"config": config, "core": core, "frontend": frontend}),
+        (r"/api/led-settings", LedSettingsHandler, {"frontend": frontend}),
         (r"/api/led-brightness", LedBrightnessHandler, {"frontend": frontend}),
         (r"/api/status", StatusHandler, {"frontend": frontend}),
         (r"/api/ping", PingHandler, {}),
@@ -487,6 +655,9 @@ def broadcast_event(obj: Any) -> None:
         # Store last scan if applicable
         if isinstance(obj, dict) and obj.get("event") == "tag_scanned":
             LAST_SCAN = {"tag_id": obj.get("tag_id"), "ts": time.time(), "uri": obj.get("uri", "")}
+        # Keep the GET /api/mappings snapshot in step with pushed updates
+        if isinstance(obj, dict) and obj.get("event") == "mappings_updated" and "mappings" in obj:
+            _set_mappings_cache(obj["mappings"])
         if _io_loop is not None:
             _io_loop.add_callback(WSHandler.broadcast, obj)
         else:
@@ -46,6 +46,10 @@ class LedConfig:
         except Exception:
             pass
 
+    def reload(self) -> None:
+        """Re-read the file, e.g. after another instance saved changes."""
+        self._load()
+
     def save(self) -> None:
         with open(self._path, "w", encoding="utf-8") as f:
             json.dump(self._data, f, indent=2)
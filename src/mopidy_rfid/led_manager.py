@@ -70,6 +70,11 @@ class LEDManager:
                 self._enabled = False
                 self._strip = None
 
+    @property
+    def led_count(self) -> int:
+        """Number of LEDs on the ring (fixed for the lifetime of the manager)."""
+        return self._led_count
+
     def show_ready(self, color: Tuple[int, int, int] = (0, 50, 0)) -> None:
         """Light the entire ring with a steady color."""
         if not self._enabled or self._strip is None or Color is None:
@@ -309,8 +314,9 @@ class LEDManager:
             except Exception:
                 logger.exception("LED: remaining_progress failed")
 
-    # Remove obsolete helpers if present
-    # (No-op placeholder to signal cleanup to tooling)
+    def reset_remain_cache(self) -> None:
+        """Forget the last drawn remaining count so the next update redraws."""
+        self._last_remain_count = None
 
     # Standby comet animation (very low brightness, slow)
     _standby_lock = threading.Lock()
@@ -518,17 +524,3 @@ class LEDManager:
                 self._paused_sweep_color = tuple(int(x) for x in color)
         except Exception:
             pass
-
-    # Fix helper syntax if present
-    try:
-        def _fix_helper_syntax():
-            pass
-    except Exception:
-        pass
-
-# Correct any lingering syntax in helper loops
-# for j in range self.led_count: -> for j in range(self._get_count()):
-# Patch any residual bad line literally
-# for j in range self.led_count:  # bad
-# should be:
-# for j in range(self._get_count()):
@@ -74,17 +74,19 @@ class MappingsDB:
             logger.exception("MappingsDB: failed to get mapping for %s", tag)
             return None
 
-    def set(self, tag: str, uri: str, description: str = "") -> None:
+    def set(self, tag: str, uri: str, description: str = "") -> bool:
         try:
             with self._lock:
                 conn = self._get_conn()
                 try:
                     conn.execute("INSERT OR REPLACE INTO mappings(tag, uri, description) VALUES(?, ?, ?)", (tag, uri, description))
                     conn.commit()
+                    return True
                 finally:
                     conn.close()
         except Exception:
             logger.exception("MappingsDB: failed to set mapping %s -> %s", tag, uri)
+            return False
 
     def delete(self, tag: str) -> bool:
         try:
@@ -23,6 +23,10 @@ class SoundsConfig:
         except Exception:
             pass
 
+    def reload(self) -> None:
+        """Re-read the file, e.g. after another instance saved changes."""
+        self._load()
+
     def save(self) -> None:
         with open(self._path, "w", encoding="utf-8") as f:
             json.dump(self._data, f, indent=2)
@@ -159,7 +159,12 @@ function handleWebSocketMessage(data) {
       }
     }
   } else if (data.event === 'mappings_updated') {
-    fetchMappings();
+    // Updates carry the full mapping list; only older servers need a refetch
+    if (data.mappings) {
+      renderMappings(data.mappings);
+    } else {
+      fetchMappings();
+    }
   }
 }
 
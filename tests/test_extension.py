@@ -16,9 +16,16 @@ def test_get_config_schema() -> None:
 
     schema = ext.get_config_schema()
 
-    # TODO Test the content of your config schema
-    # assert "username" in schema
-    # assert "password" in schema
+    assert "pin_rst" in schema
+    assert "led_count" in schema
+    assert "mappings_db_path" in schema
+
+
+def test_get_config_schema_returns_independent_copies() -> None:
+    schema = Extension().get_config_schema()
+    schema["extra"] = schema["enabled"]
+
+    assert "extra" not in Extension().get_config_schema()
 
 
 # TODO Write more tests
@@ -3,7 +3,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from mopidy_rfid.frontend import RFIDFrontend
+from mopidy_rfid.frontend import RFIDFrontend, _uri_kind
+from mopidy_rfid.sounds_config import SoundsConfig
 
 
 @pytest.fixture
@@ -16,9 +17,8 @@ def temp_db_path():
 @pytest.fixture
 def mock_hardware():
     """Mock all hardware dependencies."""
-    with patch("mopidy_rfid.frontend.RFIDManager") as mock_rfid, patch(
-        "mopidy_rfid.frontend.LEDManager"
-    ) as mock_led:
+    mock_rfid, mock_led = MagicMock(), MagicMock()
+    with patch("mopidy_rfid.frontend._load_hardware_managers", return_value=(mock_rfid, mock_led)):
         yield mock_rfid, mock_led
 
 
@@ -120,22 +120,22 @@ def test_on_tag_detected_plays_uri(mock_core, temp_db_path):
     assert mock_core.playback.play.called
 
 
-def test_on_tag_detected_toggle_play(mock_core, temp_db_path):
-    """Test TOGGLE_PLAY action."""
+@pytest.mark.parametrize(
+    "state, command",
+    [("playing", "pause"), ("paused", "resume"), ("stopped", "play")],
+)
+def test_on_tag_detected_toggle_play(mock_core, temp_db_path, state, command):
+    """Test TOGGLE_PLAY acts on the event-tracked playback state."""
     config = {"rfid": {"mappings_db_path": temp_db_path}}
     frontend = RFIDFrontend(config, mock_core)
     frontend._db.set("456", "TOGGLE_PLAY")
 
-    # Simulate playing state
-    mock_core.playback.get_state().get.return_value = "playing"
-    frontend._on_tag_detected(456)
-    assert mock_core.playback.pause.called
-
-    # Simulate paused state
+    frontend.playback_state_changed("stopped", state)
     mock_core.reset_mock()
-    mock_core.playback.get_state().get.return_value = "paused"
     frontend._on_tag_detected(456)
-    assert mock_core.playback.play.called
+
+    for name in ("pause", "resume", "play"):
+        assert getattr(mock_core.playback, name).called == (name == command)
 
 
 def test_on_tag_detected_stop(mock_core, temp_db_path):
@@ -191,3 +191,323 @@ def test_on_stop_cleans_up(mock_core, temp_db_path):
 
     mock_rfid.stop.assert_called_once()
     mock_led.shutdown.assert_called_once()
+
+
+def test_on_tag_detected_expands_album(mock_core, temp_db_path):
+    """Test album mappings are looked up and expanded before queueing."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    frontend._db.set("321", "local:album:md5:abc")
+
+    frontend._on_tag_detected(321)
+
+    mock_core.library.lookup.assert_called_with(uris=["local:album:md5:abc"])
+    assert mock_core.playback.play.called
+
+
+def test_album_tracks_added_in_single_call(mock_core, temp_db_path):
+    """Test expanded album tracks are queued with one tracklist.add call."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    frontend._detected_uri = None
+    frontend.set_mapping("555", "local:album:x")
+    tracks = [MagicMock(uri=f"local:track:{i}") for i in range(3)]
+    mock_core.library.lookup().get.return_value = {"local:album:x": tracks}
+    mock_core.tracklist.add.reset_mock()
+
+    frontend._on_tag_detected(555)
+
+    mock_core.tracklist.add.assert_called_once_with(
+        uris=["local:track:0", "local:track:1", "local:track:2"]
+    )
+
+
+def test_on_tag_detected_broadcasts(mock_core, temp_db_path):
+    """Test tag events are passed to the Web UI broadcaster."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    frontend._db.set("789", "STOP")
+
+    with patch("mopidy_rfid.http.broadcast_event") as mock_broadcast:
+        frontend._on_tag_detected(789)
+
+    mock_broadcast.assert_called_once_with(
+        {"event": "tag_scanned", "tag_id": "789", "uri": "STOP", "action": "stop"}
+    )
+
+
+def test_tag_action_refreshed_after_set_mapping(mock_core, temp_db_path):
+    """Test resolved tag actions are invalidated when the mapping changes."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    frontend.set_mapping("555", "STOP")
+    assert frontend._tag_action("555").action == "stop"
+
+    frontend.set_mapping("555", "local:track:new.mp3")
+    assert frontend._tag_action("555").action == "play"
+    assert frontend._tag_action("555").uri == "local:track:new.mp3"
+
+    frontend.delete_mapping("555")
+    assert frontend._tag_action("555").action == "none"
+
+
+def test_delete_mapping_restores_config_fallback(mock_core, temp_db_path):
+    """Test deleting a DB override falls back to the config mapping."""
+    config = {
+        "rfid": {
+            "mappings_db_path": temp_db_path,
+            "mappings": {"999": "config:uri"},
+        }
+    }
+    frontend = RFIDFrontend(config, mock_core)
+    frontend.set_mapping("999", "db:uri")
+    assert frontend.get_mapping("999") == "db:uri"
+
+    frontend.delete_mapping("999")
+    assert frontend.get_mapping("999") == "config:uri"
+
+
+@pytest.mark.parametrize(
+    ("uri", "kind"),
+    [
+        ("spotify:album:abc", "album"),
+        ("local:album:md5:abc", "album"),
+        ("spotify:playlist:abc", "playlist"),
+        ("spotify:user:someone:playlist:abc", "playlist"),
+        ("spotify:track:abc", ""),
+        ("file:///music/album/song.mp3", ""),
+    ],
+)
+def test_uri_kind(uri, kind):
+    assert _uri_kind(uri) == kind
+
+
+def test_detected_sound_and_tracks_added_together(mock_core, temp_db_path):
+    """Test the detected sound and the mapped tracks share one tracklist.add call."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    frontend._detected_uri = "file:///sounds/detected.mp3"
+    frontend.set_mapping("555", "local:album:x")
+    tracks = [MagicMock(uri="local:track:1"), MagicMock(uri="local:track:2")]
+    mock_core.library.lookup().get.return_value = {"local:album:x": tracks}
+    mock_core.tracklist.add.reset_mock()
+
+    frontend._on_tag_detected(555)
+
+    mock_core.tracklist.add.assert_called_once_with(
+        uris=["file:///sounds/detected.mp3", "local:track:1", "local:track:2"]
+    )
+
+
+def test_get_mapping_caches_unmapped_tags(mock_core, temp_db_path):
+    """Test repeated scans of an unmapped tag hit the DB only once."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+
+    with patch.object(frontend._db, "get", wraps=frontend._db.get) as db_get:
+        assert frontend.get_mapping("999") is None
+        assert frontend.get_mapping("999") is None
+    db_get.assert_called_once_with("999")
+
+    frontend.set_mapping("999", "local:track:new.mp3")
+    assert frontend.get_mapping("999") == "local:track:new.mp3"
+
+
+def test_playback_events_wake_progress_updater(mock_core, temp_db_path):
+    """Test core playback events update cached state and wake the LED updater."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    tl_track = MagicMock()
+
+    frontend.playback_state_changed("stopped", "playing")
+    assert frontend._playback_state == "playing"
+    assert frontend._progress_wake.is_set()
+
+    frontend._progress_wake.clear()
+    frontend.track_playback_started(tl_track)
+    assert frontend._cur_tl_track is tl_track
+    assert frontend._progress_wake.is_set()
+
+
+def test_invalidate_config_cache_reloads_sounds(mock_core, temp_db_path, tmp_path):
+    """Test sound changes saved elsewhere are picked up after invalidation."""
+    sounds_path = str(tmp_path / "sounds.json")
+    config = {"rfid": {"mappings_db_path": temp_db_path, "sounds_config_path": sounds_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    assert frontend._detected_uri is None
+
+    SoundsConfig(sounds_path).set("detected", "file:///sounds/detected.mp3")
+    frontend.invalidate_config_cache()
+
+    assert frontend._detected_uri == "file:///sounds/detected.mp3"
+
+
+def test_on_stop_waits_only_while_farewell_plays(mock_core, temp_db_path):
+    """Test on_stop returns as soon as the farewell sound has finished."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    frontend._farewell_uri = "file:///sounds/farewell.mp3"
+    mock_core.playback.get_state().get.side_effect = ["playing", "stopped"]
+
+    frontend.on_stop()
+
+    assert mock_core.playback.get_state().get.call_count == 2
+
+
+def test_position_extrapolated_from_events(mock_core, temp_db_path):
+    """Test playback position is tracked locally from core events, in Mopidy's order."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    tl_track = MagicMock()
+    now = [100.0]
+
+    with patch("mopidy_rfid.frontend.time.monotonic", side_effect=lambda: now[0]):
+        frontend.playback_state_changed("stopped", "playing")
+        frontend.track_playback_started(tl_track)
+        now[0] = 110.0
+        assert frontend._position_ms() == 10000
+
+        # pause(): state change first, then track_playback_paused
+        frontend.playback_state_changed("playing", "paused")
+        frontend.track_playback_paused(tl_track, 10000)
+        now[0] = 170.0
+        assert frontend._position_ms() == 10000
+
+        # resume(): state change first; the pause must not count as played time
+        frontend.playback_state_changed("paused", "playing")
+        assert frontend._position_ms() == 10000
+        frontend.track_playback_resumed(tl_track, 10000)
+        now[0] = 172.0
+        assert frontend._position_ms() == 12000
+
+
+def test_probe_file_length_ms_cached_per_uri():
+    """Test mutagen is only consulted once per file URI."""
+    from mopidy_rfid.frontend import _cached_file_length_ms, _probe_file_length_ms
+
+    _cached_file_length_ms.cache_clear()
+    audio = MagicMock()
+    audio.info.length = 12.5
+    mutagen = MagicMock()
+    mutagen.File.return_value = audio
+    with patch.dict("sys.modules", {"mutagen": mutagen}):
+        assert _probe_file_length_ms("file:///music/a.mp3") == 12500
+        assert _probe_file_length_ms("file:///music/a.mp3") == 12500
+    mutagen.File.assert_called_once_with("/music/a.mp3")
+    _cached_file_length_ms.cache_clear()
+
+
+def test_probe_file_length_ms_retries_failures():
+    """Test a failed probe (e.g. mount not ready yet) is retried on the next call."""
+    from mopidy_rfid.frontend import _cached_file_length_ms, _probe_file_length_ms
+
+    _cached_file_length_ms.cache_clear()
+    audio = MagicMock()
+    audio.info.length = 3.0
+    mutagen = MagicMock()
+    mutagen.File.side_effect = [None, audio]
+    with patch.dict("sys.modules", {"mutagen": mutagen}):
+        assert _probe_file_length_ms("file:///usb/b.mp3") is None
+        assert _probe_file_length_ms("file:///usb/b.mp3") == 3000
+    _cached_file_length_ms.cache_clear()
+
+
+def test_init_hardware_starts_led_and_rfid(mock_core, mock_hardware, temp_db_path):
+    """Test hardware init brings up both the LED ring and the RFID reader."""
+    mock_rfid, mock_led = mock_hardware
+    config = {"rfid": {"mappings_db_path": temp_db_path, "led_count": 12}}
+    frontend = RFIDFrontend(config, mock_core)
+
+    frontend._init_hardware()
+    frontend._stop_progress_updater()
+    frontend._executor.shutdown(wait=True)
+
+    assert mock_led.call_args.kwargs["led_count"] == 12
+    mock_rfid.return_value.start.assert_called_once()
+
+
+def test_init_hardware_plays_led_welcome(mock_core, mock_hardware, temp_db_path):
+    """Test the LED welcome animation runs once the ring is initialized."""
+    _, mock_led = mock_hardware
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+    frontend._cfg_welcome = True
+
+    frontend._init_hardware()
+    frontend._stop_progress_updater()
+    frontend._executor.shutdown(wait=True)
+
+    mock_led.return_value.welcome_scan.assert_called_once()
+
+
+def test_bluetooth_check_cached_briefly(mock_core, temp_db_path):
+    """Test repeated Bluetooth checks within the TTL reuse the last result."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+
+    with patch.object(frontend, "_check_bluetooth_audio", return_value=True) as check:
+        assert frontend._is_bluetooth_audio_connected() is True
+        assert frontend._is_bluetooth_audio_connected() is True
+    check.assert_called_once()
+
+
+def test_bt_watcher_updates_on_sink_events(mock_core, temp_db_path):
+    """Test pactl sink events refresh the cached Bluetooth status."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+
+    proc = MagicMock()
+    proc.stdout.__iter__.return_value = [
+        "Event 'change' on server #0\n",
+        "Event 'new' on sink #3\n",
+    ]
+    proc.poll.return_value = None
+    with patch("shutil.which", return_value="/usr/bin/pactl"), \
+            patch("subprocess.Popen", return_value=proc), \
+            patch.object(frontend, "_check_bluetooth_audio", return_value=True) as check, \
+            patch("threading.Thread") as thread_cls:
+        frontend._start_bt_watcher()
+        # Run the watcher loop inline
+        thread_cls.call_args.kwargs["target"]()
+
+    check.assert_called_once()
+    assert frontend._bt_connected is True
+    assert frontend._is_bluetooth_audio_connected() is True
+
+    frontend._stop_bt_watcher()
+    proc.terminate.assert_called_once()
+    proc.wait.assert_called_once_with(timeout=1)
+    proc.stdout.close.assert_called_once()
+
+
+def test_on_tag_detected_without_core(temp_db_path):
+    """Test a mapped command tag is ignored with a warning when core is unavailable."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, None)
+    frontend.set_mapping("123", "TOGGLE_PLAY")
+
+    with patch("mopidy_rfid.frontend.logger") as log:
+        frontend._on_tag_detected(123)
+
+    log.warning.assert_called_with("Core not available; cannot execute mapping for %s", "123")
+    log.exception.assert_not_called()
+
+
+def test_get_mapping_does_not_overwrite_concurrent_set(mock_core, temp_db_path):
+    """Test a stale DB read on a cache miss does not replace a mapping saved meanwhile."""
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    frontend = RFIDFrontend(config, mock_core)
+
+    def db_get(tag):
+        # Web UI save lands while the scan is reading the DB
+        frontend._mappings[tag] = "spotify:track:new"
+        return None
+
+    with patch.object(frontend._db, "get", side_effect=db_get):
+        assert frontend.get_mapping("999") == "spotify:track:new"
+    assert frontend.get_mapping("999") == "spotify:track:new"
+
+
+def test_ping(mock_core, temp_db_path):
+    config = {"rfid": {"mappings_db_path": temp_db_path}}
+    assert RFIDFrontend(config, mock_core).ping() is True
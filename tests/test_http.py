@@ -1,8 +1,10 @@
+import asyncio
 import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 import tornado.testing
+import tornado.websocket
 
 from mopidy_rfid import http
 
@@ -18,7 +20,7 @@ class TestHTTPHandlers(tornado.testing.AsyncHTTPTestCase):
             "123": "spotify:track:test",
             "456": "TOGGLE_PLAY",
         }
-        mock_proxy.set_mapping().get.return_value = None
+        mock_proxy.set_mapping().get.return_value = True
         mock_proxy.delete_mapping().get.return_value = True
 
         mock_actor_ref = MagicMock()
@@ -124,3 +126,156 @@ def test_broadcast_event_helper():
     with patch.object(http.WSHandler, "broadcast") as mock_broadcast:
         http.broadcast_event({"test": "data"})
         mock_broadcast.assert_called_once_with({"test": "data"})
+
+
+def test_mappings_updated_event_refreshes_cache():
+    """A pushed mappings_updated event replaces the cached mappings snapshot."""
+    frontend = MagicMock()
+    mappings = {"123": {"uri": "spotify:track:test", "description": ""}}
+    with patch.object(http, "_mappings_snapshot", http._MappingsSnapshot()), patch.object(http.WSHandler, "broadcast"):
+        http.broadcast_event({"event": "mappings_updated", "mappings": mappings})
+        assert asyncio.run(http._get_mappings(frontend)) == mappings
+        frontend.proxy.assert_not_called()
+
+
+class TestBrowseHandler(tornado.testing.AsyncHTTPTestCase):
+    """Test library browsing fan-out."""
+
+    def get_app(self):
+        def ref(uri, type_, name):
+            r = MagicMock(uri=uri, type=type_)
+            r.name = name
+            return r
+
+        tree = {
+            None: [ref("local:directory", "directory", "Local")],
+            "local:directory": [
+                ref("local:track:a.mp3", "track", "A"),
+                ref("local:album:x", "album", "X"),
+            ],
+            "local:album:x": [ref("local:track:b.mp3", "track", "B")],
+        }
+
+        def browse(uri=None):
+            future = MagicMock()
+            future.get.return_value = tree.get(uri, [])
+            return future
+
+        http._http_cache.clear()
+        self.mock_core = MagicMock()
+        self.mock_core.library.browse.side_effect = browse
+        return tornado.web.Application([(r"/api/browse", http.BrowseHandler, {"core": self.mock_core})])
+
+    def test_browse_tracks_includes_album_contents(self):
+        response = self.fetch("/api/browse?type=track")
+        assert response.code == 200
+        uris = [i["uri"] for i in json.loads(response.body)["items"]]
+        assert uris == ["local:track:a.mp3", "local:track:b.mp3"]
+
+    def test_browse_result_cached(self):
+        first = self.fetch("/api/browse?type=track")
+        calls = self.mock_core.library.browse.call_count
+        second = self.fetch("/api/browse?type=track")
+        assert second.body == first.body
+        assert self.mock_core.library.browse.call_count == calls
+
+    def test_browse_with_failed_source_not_cached(self):
+        failing = MagicMock()
+        failing.get.side_effect = RuntimeError("backend timeout")
+        browse = self.mock_core.library.browse.side_effect
+        self.mock_core.library.browse.side_effect = (
+            lambda uri=None: failing if uri == "local:album:x" else browse(uri=uri)
+        )
+        response = self.fetch("/api/browse?type=track")
+        assert response.code == 200
+        assert "browse:track" not in http._http_cache
+
+
+def test_http_cache_bounded_and_expiring():
+    """The response cache drops expired entries and keeps at most _HTTP_CACHE_MAX."""
+    with patch.object(http, "_http_cache", {}):
+        for i in range(http._HTTP_CACHE_MAX + 5):
+            http._cache_put(f"search:{i}", {"results": []})
+        assert len(http._http_cache) == http._HTTP_CACHE_MAX
+        assert "search:0" not in http._http_cache
+        with patch("mopidy_rfid.http.time.monotonic", return_value=http.time.monotonic() + 60):
+            assert http._cache_get("search:10") is None
+            assert "search:10" not in http._http_cache
+
+
+def test_websocket_broadcast_drops_closed_clients():
+    """Clients whose connection is gone are removed on the next broadcast."""
+    closed = MagicMock()
+    closed.write_message.side_effect = tornado.websocket.WebSocketClosedError()
+    alive = MagicMock()
+    with patch.object(http.WSHandler, "clients", {closed, alive}):
+        http.WSHandler.broadcast({"event": "test"})
+        assert http.WSHandler.clients == {alive}
+    alive.write_message.assert_called_once()
+
+
+def test_websocket_compression_enabled():
+    handler = http.WSHandler.__new__(http.WSHandler)
+    assert handler.get_compression_options() is not None
+
+
+def test_mappings_json_encoded_once():
+    """GET payload bytes are reused until the snapshot changes."""
+    mappings = {"123": {"uri": "spotify:track:test", "description": ""}}
+    with patch.object(http, "_mappings_snapshot", http._MappingsSnapshot()):
+        http._set_mappings_cache(mappings)
+        first = asyncio.run(http._get_mappings_json(MagicMock()))
+        assert json.loads(first) == mappings
+        assert asyncio.run(http._get_mappings_json(MagicMock())) is first
+        http._set_mappings_cache({})
+        assert json.loads(asyncio.run(http._get_mappings_json(MagicMock()))) == {}
+
+
+def test_artist_names():
+    a, b = MagicMock(), MagicMock()
+    a.name, b.name = "A", None
+    assert http._artist_names([a, b]) == "A, "
+    assert http._artist_names(None) == ""
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_helpers_round_trip(use_orjson):
+    """JSON helpers work with and without orjson installed."""
+    obj = {"tag": "123", "uri": "spotify:track:ä"}
+    orjson_mod = http.orjson if use_orjson else None
+    if use_orjson and orjson_mod is None:
+        pytest.skip("orjson not installed")
+    with patch.object(http, "orjson", orjson_mod):
+        assert http._json_loads(http._json_bytes(obj)) == obj
+
+
+class TestMappingsPost(tornado.testing.AsyncHTTPTestCase):
+    """Test POST /api/mappings reports whether the mapping was stored."""
+
+    def get_app(self):
+        self.proxy = MagicMock()
+        frontend = MagicMock()
+        frontend.proxy.return_value = self.proxy
+        return tornado.web.Application([(r"/api/mappings", http.MappingsHandler, {"frontend": frontend})])
+
+    def _post(self):
+        body = json.dumps({"tag": "789", "uri": "local:track:test.mp3"})
+        return self.fetch("/api/mappings", method="POST", body=body)
+
+    def test_failed_write_not_reported_or_broadcast(self):
+        self.proxy.set_mapping.return_value.get.return_value = False
+        with patch.object(http, "broadcast_event") as broadcast:
+            response = self._post()
+        assert response.code == 500
+        assert json.loads(response.body)["ok"] is False
+        broadcast.assert_not_called()
+
+    def test_stored_write_broadcast(self):
+        self.proxy.set_mapping.return_value.get.return_value = True
+        self.proxy.list_mappings.return_value.get.return_value = {}
+        with patch.object(http, "_mappings_snapshot", http._MappingsSnapshot()), \
+                patch.object(http, "broadcast_event") as broadcast:
+            response = self._post()
+        assert response.code == 200
+        event = broadcast.call_args.args[0]
+        assert event["mappings"]["789"]["uri"] == "local:track:test.mp3"
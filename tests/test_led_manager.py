@@ -106,3 +106,11 @@ def test_led_disabled_no_crash(mock_gpio):
     manager.flash_confirm()
     manager.shutdown()
     # Should not raise any exceptions
+
+
+def test_reset_remain_cache():
+    """Test resetting the remaining-LED cache."""
+    manager = LEDManager(led_enabled=True, led_count=16)
+    manager._last_remain_count = 8
+    manager.reset_remain_cache()
+    assert manager._last_remain_count is None
@@ -1,6 +1,8 @@
 import os
+import sqlite3
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -104,3 +106,10 @@ def test_default_db_path():
     db = MappingsDB()
     expected_path = os.path.expanduser("~/.config/mopidy-rfid/mappings.db")
     assert db._path == expected_path
+
+
+def test_set_reports_failure(temp_db):
+    """set() returns False when the write fails."""
+    db = MappingsDB(temp_db)
+    with patch.object(db, "_get_conn", side_effect=sqlite3.OperationalError("database is locked")):
+        assert db.set("123", "uri") is False